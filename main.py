@@ -8,15 +8,57 @@ with OpenAI-powered explanations for complete resource management.
 
 import argparse
 import getpass
+import json
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from tfiam import CyberCLI, OpenAIAnalyzer, PolicyGenerator, TerraformAnalyzer, print_cyberpunk_help
+from tfiam import (
+    CyberCLI,
+    PolicyGenerator,
+    TerraformAnalyzer,
+    create_loading_spinner,
+    print_cyberpunk_help,
+    print_header,
+    print_summary,
+)
+
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.S)
+_JSON_DECODER = json.JSONDecoder()
+_TRAILING_COMMA_RE = re.compile(r",(\s*[}\]])")
+_MISSING_COMMA_RE = re.compile(r'"\s*\n\s*"')
+_MISSING_PROP_COMMA_RE = re.compile(r'"\s*\n\s*"([A-Za-z])')
+
+
+_YES_ANSWERS = frozenset({"y", "yes"})
+_NO_ANSWERS = frozenset({"n", "no"})
+
+
+def _ask_yn(prompt, default=None):
+    """
+    Ask a yes/no question.
+
+    When TFIAM_ASSUME_YES is set the prompt is skipped: questions with a default get that
+    default, and only action confirmations without one are answered yes.
+    """
+    if os.getenv("TFIAM_ASSUME_YES", "").strip().lower() in {"1", "true", "y", "yes"}:
+        return True if default is None else default
+
+    while True:
+        answer = input(prompt).strip().lower()
+        if answer in _YES_ANSWERS:
+            return True
+        if answer in _NO_ANSWERS:
+            return False
+        if not answer and default is not None:
+            return default
+        print(f"{CyberCLI.RED}Please enter 'y' for yes or 'n' for no.{CyberCLI.END}")
 
 
 def get_openai_key():
@@ -43,16 +85,65 @@ def get_openai_key():
             break
         print(f"{CyberCLI.RED}Please enter a valid API key.{CyberCLI.END}")
 
-    # Ask if user wants to save it permanently
-    save = input(
-        f"{CyberCLI.CYAN}Would you like to save this key to your shell profile? (y/n): {CyberCLI.END}"
-    ).lower()
-    if save in ["y", "yes"]:
+    # Ask if user wants to save it permanently; the default keeps assume-yes runs from ever
+    # writing the key to the profile
+    if _ask_yn(
+        f"{CyberCLI.CYAN}Would you like to save this key to your shell profile? (y/n): {CyberCLI.END}",
+        default=False,
+    ):
         save_key_to_profile(key)
 
     return key
 
 
+def _wait_for_verification(verification_future, quiet):
+    """Wait for the background verification, showing a spinner while it is still running."""
+    # The spinner only runs while nothing else prints, so it never draws over progress lines
+    spinner = None
+    if not quiet and not verification_future.done():
+        spinner = create_loading_spinner("🔍 AI Analyzing Policy", CyberCLI.CYAN)
+        spinner.start()
+    try:
+        wait([verification_future])
+    finally:
+        if spinner:
+            spinner.stop("✅ AI Analysis Complete!")
+
+
+def _enhance_statements(openai_analyzer, statements, verification_future, use_batch, quiet):
+    """Add AI explanations to the statements while verification runs in the background."""
+    # Small policies are explained by the verification request, so wait for it
+    # and let enhancement pick the explanations up from the cache
+    if len(statements) <= openai_analyzer.COMBINED_EXPLANATION_MAX_STATEMENTS:
+        _wait_for_verification(verification_future, quiet)
+
+    # Process statements with progress tracking
+    if not quiet:
+        print(f"{CyberCLI.CYAN}📊 Processing statements:{CyberCLI.END}")
+
+    if use_batch:
+        statements = openai_analyzer.enhance_statements_batch(statements, quiet)
+    else:
+        statements = openai_analyzer.enhance_statements_with_progress(statements, quiet)
+
+    if not quiet:
+        print(
+            f"\n{CyberCLI.GREEN}✅ Successfully enhanced {len(statements)} statements with AI explanations{CyberCLI.END}"
+        )
+
+        # Display cache statistics
+        cache_stats = openai_analyzer.get_cache_stats()
+        if cache_stats["total_requests"] > 0:
+            print(f"\n{CyberCLI.CYAN}📦 Cache Statistics:{CyberCLI.END}")
+            print(f"  Cache hits: {cache_stats['cache_hits']} ({cache_stats['hit_rate']:.1f}%)")
+            print(f"  Cache misses: {cache_stats['cache_misses']}")
+            print(f"  Total cached responses: {cache_stats['cache_size']}")
+            if cache_stats["hit_rate"] > 0:
+                print(f"  💰 Cost savings: ~${cache_stats['cache_hits'] * 0.002:.3f} (estimated)")
+
+    return statements
+
+
 def _display_verification_results(verification_result):
     """Display AI verification and optimization results."""
     print(f"\n{CyberCLI.MAGENTA}🔍 AI Policy Verification Results:{CyberCLI.END}")
@@ -147,26 +238,16 @@ def _show_optimization_prompt(
         )
 
     # Ask if user wants optimization
-    while True:
-        choice = (
-            input(
-                f"\n{CyberCLI.CYAN}Would you like AI to generate an optimized policy? (y/n): {CyberCLI.END}"
-            )
-            .strip()
-            .lower()
+    if _ask_yn(
+        f"\n{CyberCLI.CYAN}Would you like AI to generate an optimized policy? (y/n): {CyberCLI.END}"
+    ):
+        _generate_optimized_policy(
+            openai_analyzer, statements, resources, directory, output_dir, verification_result
+        )
+    else:
+        print(
+            f"{CyberCLI.GRAY}No optimization requested. Your current policy is ready for use.{CyberCLI.END}"
         )
-        if choice in ["y", "yes"]:
-            _generate_optimized_policy(
-                openai_analyzer, statements, resources, directory, output_dir, verification_result
-            )
-            break
-        elif choice in ["n", "no"]:
-            print(
-                f"{CyberCLI.GRAY}No optimization requested. Your current policy is ready for use.{CyberCLI.END}"
-            )
-            break
-        else:
-            print(f"{CyberCLI.RED}Please enter 'y' for yes or 'n' for no.{CyberCLI.END}")
 
 
 def _generate_optimized_policy(
@@ -186,10 +267,10 @@ def _generate_optimized_policy(
 
         # Validate and save the optimized policy
         optimized_filename = os.path.join(output_dir, "tf-ai-permissions-ai-powered.json")
+        original_statements = len(statements)
+        original_permissions = sum(len(stmt.action) for stmt in statements)
 
         try:
-            import json
-
             # Validate JSON
             optimized_policy = json.loads(optimized_policy_json)
 
@@ -205,27 +286,7 @@ def _generate_optimized_policy(
             )
             print(f"{CyberCLI.GRAY}📁 Location: {optimized_filename}{CyberCLI.END}")
 
-            # Show comparison
-            original_statements = len(statements)
-            optimized_statements = len(optimized_policy.get("Statement", []))
-            original_permissions = sum(len(stmt.action) for stmt in statements)
-            optimized_permissions = sum(
-                len(stmt.get("Action", [])) for stmt in optimized_policy.get("Statement", [])
-            )
-
-            print(f"\n{CyberCLI.CYAN}📊 Policy Comparison:{CyberCLI.END}")
-            print(
-                f"  Original: {original_statements} statements, {original_permissions} permissions"
-            )
-            print(
-                f"  Optimized: {optimized_statements} statements, {optimized_permissions} permissions"
-            )
-
-            if optimized_permissions < original_permissions:
-                reduction = original_permissions - optimized_permissions
-                print(
-                    f"  🎯 Reduced permissions by {reduction} ({reduction/original_permissions*100:.1f}%)"
-                )
+            _print_policy_comparison(original_statements, original_permissions, optimized_policy)
 
         except json.JSONDecodeError as e:
             print(
@@ -252,28 +313,10 @@ def _generate_optimized_policy(
                     f"{CyberCLI.CYAN}📄 File: {os.path.basename(optimized_filename)} ({optimized_size:,} bytes){CyberCLI.END}"
                 )
 
-                # Show comparison
-                original_statements = len(statements)
-                optimized_statements = len(optimized_policy.get("Statement", []))
-                original_permissions = sum(len(stmt.action) for stmt in statements)
-                optimized_permissions = sum(
-                    len(stmt.get("Action", [])) for stmt in optimized_policy.get("Statement", [])
-                )
-
-                print(f"\n{CyberCLI.CYAN}📊 Policy Comparison:{CyberCLI.END}")
-                print(
-                    f"  Original: {original_statements} statements, {original_permissions} permissions"
-                )
-                print(
-                    f"  Optimized: {optimized_statements} statements, {optimized_permissions} permissions"
+                _print_policy_comparison(
+                    original_statements, original_permissions, optimized_policy
                 )
 
-                if optimized_permissions < original_permissions:
-                    reduction = original_permissions - optimized_permissions
-                    print(
-                        f"  🎯 Reduced permissions by {reduction} ({reduction/original_permissions*100:.1f}%)"
-                    )
-
             except json.JSONDecodeError as fix_error:
                 print(f"{CyberCLI.RED}❌ Could not fix JSON issues: {fix_error}{CyberCLI.END}")
                 # Save as text file if all fixes fail
@@ -290,38 +333,34 @@ def _generate_optimized_policy(
         # Append optimization analysis to the main report
         main_report_filename = os.path.join(output_dir, "tf-ai-permissions-report.md")
 
-        with open(main_report_filename, "a", encoding="utf-8") as f:
-            f.write("\n\n---\n\n")
-            f.write("# AI Policy Optimization Analysis\n\n")
-            f.write(
-                f"**Optimization Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-            )
-
-            f.write("## Optimization Summary\n\n")
-            f.write(verification_result.get("raw_analysis", ""))
-            f.write("\n\n")
-
-            f.write("## Generated Optimized Policy\n\n")
-            f.write("The AI has generated an optimized IAM policy based on the analysis above.\n\n")
-            f.write("### Key Optimizations Applied:\n")
-            f.write("- Applied principle of least privilege\n")
-            f.write("- Used specific resource ARNs where possible\n")
-            f.write("- Removed unnecessary permissions\n")
-            f.write("- Grouped related permissions efficiently\n")
-            f.write("- Followed AWS security best practices\n\n")
-
-            f.write("### Files Generated:\n")
-            f.write(f"- `tf-ai-permissions-ai-powered.json` - Optimized IAM policy\n")
-            f.write(f"- `tf-ai-permissions.json` - Original policy for comparison\n\n")
-
-            f.write("## Next Steps\n\n")
-            f.write("1. Review the optimized policy carefully\n")
-            f.write("2. Test in a development environment\n")
-            f.write("3. Compare with your original policy\n")
-            f.write("4. Apply the optimized policy to your infrastructure\n")
-            f.write("5. Monitor for any permission issues\n\n")
+        optimization_section = (
+            "\n\n---\n\n"
+            "# AI Policy Optimization Analysis\n\n"
+            f"**Optimization Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+            "## Optimization Summary\n\n"
+            f"{verification_result.get('raw_analysis', '')}\n\n"
+            "## Generated Optimized Policy\n\n"
+            "The AI has generated an optimized IAM policy based on the analysis above.\n\n"
+            "### Key Optimizations Applied:\n"
+            "- Applied principle of least privilege\n"
+            "- Used specific resource ARNs where possible\n"
+            "- Removed unnecessary permissions\n"
+            "- Grouped related permissions efficiently\n"
+            "- Followed AWS security best practices\n\n"
+            "### Files Generated:\n"
+            "- `tf-ai-permissions-ai-powered.json` - Optimized IAM policy\n"
+            "- `tf-ai-permissions.json` - Original policy for comparison\n\n"
+            "## Next Steps\n\n"
+            "1. Review the optimized policy carefully\n"
+            "2. Test in a development environment\n"
+            "3. Compare with your original policy\n"
+            "4. Apply the optimized policy to your infrastructure\n"
+            "5. Monitor for any permission issues\n\n"
+            "*Generated by TFIAM AI Optimization Engine*\n"
+        )
 
-            f.write("*Generated by TFIAM AI Optimization Engine*\n")
+        with open(main_report_filename, "a", encoding="utf-8") as f:
+            f.write(optimization_section)
 
         report_size = os.path.getsize(main_report_filename)
         print(
@@ -335,6 +374,22 @@ def _generate_optimized_policy(
         )
 
 
+def _print_policy_comparison(original_statements, original_permissions, optimized_policy):
+    """Print statement and permission counts for the original and optimized policies."""
+    optimized_statements = len(optimized_policy.get("Statement", []))
+    optimized_permissions = sum(
+        len(stmt.get("Action", [])) for stmt in optimized_policy.get("Statement", [])
+    )
+
+    print(f"\n{CyberCLI.CYAN}📊 Policy Comparison:{CyberCLI.END}")
+    print(f"  Original: {original_statements} statements, {original_permissions} permissions")
+    print(f"  Optimized: {optimized_statements} statements, {optimized_permissions} permissions")
+
+    if optimized_permissions < original_permissions:
+        reduction = original_permissions - optimized_permissions
+        print(f"  🎯 Reduced permissions by {reduction} ({reduction/original_permissions*100:.1f}%)")
+
+
 def _format_statements_for_ai(statements):
     """Format IAM statements for AI analysis."""
     formatted = []
@@ -350,104 +405,60 @@ def _format_statements_for_ai(statements):
 
 def _extract_json_from_response(response_text):
     """Extract JSON from AI response, handling markdown formatting and incomplete responses."""
-    import json
+    # JSON-mode responses are already a bare object, so skip the repair scan entirely.
+    # The scan below is kept for cached responses generated before JSON mode was used.
+    stripped = response_text.strip()
+    if stripped.startswith("{") and stripped.endswith("}"):
+        return stripped
 
     # Remove markdown code blocks
-    if "```json" in response_text:
-        start = response_text.find("```json") + 7
-        end = response_text.find("```", start)
-        if end > start:
-            response_text = response_text[start:end]
-    elif "```" in response_text:
-        start = response_text.find("```") + 3
-        end = response_text.find("```", start)
-        if end > start:
-            response_text = response_text[start:end]
+    fenced = _FENCED_JSON_RE.search(response_text)
+    if fenced:
+        response_text = fenced.group(1)
 
     # Find JSON object boundaries
     start_brace = response_text.find("{")
+    if start_brace == -1:
+        return response_text.strip()
+    response_text = response_text[start_brace:]
 
-    if start_brace != -1:
-        response_text = response_text[start_brace:]
-
-        # Try to find a complete JSON object
-        brace_count = 0
-        in_string = False
-        escape_next = False
-        end_pos = -1
-
-        for i, char in enumerate(response_text):
-            if escape_next:
-                escape_next = False
-                continue
-            if char == "\\":
-                escape_next = True
-                continue
-            if char == '"' and not escape_next:
-                in_string = not in_string
-                continue
-            if not in_string:
-                if char == "{":
-                    brace_count += 1
-                elif char == "}":
-                    brace_count -= 1
-                    if brace_count == 0:
-                        end_pos = i
-                        break
-
-        if end_pos != -1:
-            # Found complete JSON
-            response_text = response_text[: end_pos + 1]
-        else:
-            # Try to complete the JSON
-            response_text = _complete_incomplete_json(response_text)
+    try:
+        # The C decoder stops at the end of the first complete object
+        _, end_pos = _JSON_DECODER.raw_decode(response_text)
+        return response_text[:end_pos]
+    except json.JSONDecodeError:
+        pass
+
+    # Closed but malformed objects are left for _fix_json_formatting to repair
+    end_brace = response_text.rfind("}")
+    closed_text = response_text[: end_brace + 1]
+    if end_brace != -1 and closed_text.count("{") == closed_text.count("}"):
+        return closed_text
 
-    return response_text.strip()
+    # Try to complete the JSON
+    return _complete_incomplete_json(response_text).strip()
 
 
 def _fix_json_formatting(json_text):
     """Fix common JSON formatting issues."""
-    import re
-
     # Remove trailing commas before closing braces/brackets
-    json_text = re.sub(r",(\s*[}\]])", r"\1", json_text)
+    json_text = _TRAILING_COMMA_RE.sub(r"\1", json_text)
 
     # Fix missing commas between array elements
-    json_text = re.sub(r'"\s*\n\s*"', '",\n    "', json_text)
+    json_text = _MISSING_COMMA_RE.sub('",\n    "', json_text)
 
     # Fix missing commas between object properties
-    json_text = re.sub(r'"\s*\n\s*"([A-Za-z])', r'",\n    "\1', json_text)
-
-    # Ensure proper indentation
-    lines = json_text.split("\n")
-    fixed_lines = []
-    indent_level = 0
-
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            fixed_lines.append("")
-            continue
+    json_text = _MISSING_PROP_COMMA_RE.sub(r'",\n    "\1', json_text)
 
-        # Adjust indent level based on braces/brackets
-        if stripped.startswith("}") or stripped.startswith("]"):
-            indent_level = max(0, indent_level - 1)
-
-        # Apply proper indentation
-        indent = "  " * indent_level
-        fixed_lines.append(indent + stripped)
-
-        # Increase indent for opening braces/brackets
-        if stripped.endswith("{") or stripped.endswith("["):
-            indent_level += 1
-
-    return "\n".join(fixed_lines)
+    # Reindent with the stdlib formatter; unparseable text is returned as-is for the caller
+    try:
+        return json.dumps(json.loads(json_text), indent=2, ensure_ascii=False)
+    except json.JSONDecodeError:
+        return json_text
 
 
 def _complete_incomplete_json(json_text):
     """Complete an incomplete JSON response with robust parsing."""
-    import re
-
     json_text = json_text.strip()
 
     # Find the last incomplete line
@@ -517,11 +528,16 @@ def save_key_to_profile(key):
         profile_file = os.path.expanduser("~/.bashrc")
         print(f"{CyberCLI.CYAN}Using default profile: {profile_file}{CyberCLI.END}")
 
-    # Check if key already exists in profile
+    # Add key to profile unless it is already there, using a single open
+    export_line = f'\n# OpenAI API Key for TFIAM\nexport OPENAI_API_KEY="{key}"\n'
     try:
-        with open(profile_file, "r") as f:
-            content = f.read()
-            if "OPENAI_API_KEY" in content:
+        if not os.path.exists(profile_file):
+            print(
+                f"{CyberCLI.CYAN}Profile file not found, will create: {profile_file}{CyberCLI.END}"
+            )
+        with open(profile_file, "a+") as f:
+            f.seek(0)
+            if "OPENAI_API_KEY" in f.read():
                 print(
                     f"{CyberCLI.YELLOW}⚠️  OpenAI API key already exists in {profile_file}{CyberCLI.END}"
                 )
@@ -529,13 +545,6 @@ def save_key_to_profile(key):
                     f"{CyberCLI.CYAN}The key should be available in new terminal sessions.{CyberCLI.END}"
                 )
                 return
-    except FileNotFoundError:
-        print(f"{CyberCLI.CYAN}Profile file not found, will create: {profile_file}{CyberCLI.END}")
-
-    # Add key to profile
-    export_line = f'\n# OpenAI API Key for TFIAM\nexport OPENAI_API_KEY="{key}"\n'
-    try:
-        with open(profile_file, "a") as f:
             f.write(export_line)
         print(f"{CyberCLI.GREEN}✅ OpenAI API key saved to {profile_file}{CyberCLI.END}")
         print(f"{CyberCLI.CYAN}📝 Added to profile: {os.path.basename(profile_file)}{CyberCLI.END}")
@@ -557,20 +566,18 @@ def save_key_to_profile(key):
 
 def check_terraform_files(directory):
     """Check if directory contains Terraform files (only in the specified directory, not subdirectories)."""
-    tf_files = []
     try:
-        files = os.listdir(directory)
-        for file in files:
-            if file.endswith(".tf") and os.path.isfile(os.path.join(directory, file)):
-                tf_files.append(file)
+        with os.scandir(directory) as entries:
+            return tuple(
+                entry.name for entry in entries if entry.name.endswith(".tf") and entry.is_file()
+            )
     except OSError:
-        pass  # Directory doesn't exist or can't be accessed
-    return tf_files
+        return ()  # Directory doesn't exist or can't be accessed
 
 
 def interactive_mode():
     """Interactive mode when no arguments are provided."""
-    CyberCLI.print_header()
+    print_header()
 
     print(f"{CyberCLI.CYAN}🌐 Welcome to TFIAM Interactive Mode!{CyberCLI.END}")
     print(
@@ -603,11 +610,10 @@ def interactive_mode():
             print(
                 f"{CyberCLI.GRAY}Please ensure your directory contains Terraform configuration files.{CyberCLI.END}"
             )
-            print(
+            if not _ask_yn(
                 f"\n{CyberCLI.CYAN}Would you like to try a different directory? (y/n): {CyberCLI.END}",
-                end="",
-            )
-            if input().lower() not in ["y", "yes"]:
+                default=False,
+            ):
                 print(f"{CyberCLI.YELLOW}Exiting...{CyberCLI.END}")
                 sys.exit(1)
             continue
@@ -646,7 +652,7 @@ def interactive_mode():
         output_dir = "tfiam-output"
 
     # Get quiet mode preference
-    quiet = input(f"{CyberCLI.CYAN}🔇 Quiet mode? (y/n): {CyberCLI.END}").lower() in ["y", "yes"]
+    quiet = _ask_yn(f"{CyberCLI.CYAN}🔇 Quiet mode? (y/n): {CyberCLI.END}", default=False)
 
     return {
         "directory": directory,
@@ -724,6 +730,10 @@ def main():
             clear_cache = config["clear_cache"]
             output_dir = config["output_dir"]
             quiet = config["quiet"]
+            use_batch = False
+            cache_dir = None
+            requests_per_minute = None
+            tokens_per_minute = None
         except KeyboardInterrupt:
             print(f"\n{CyberCLI.YELLOW}Operation cancelled by user.{CyberCLI.END}")
             return
@@ -748,6 +758,28 @@ def main():
         parser.add_argument(
             "--no-cache", action="store_true", help="Clear AI cache and generate fresh analysis"
         )
+        parser.add_argument(
+            "--cache-dir",
+            default=None,
+            help="Directory for cached AI responses (default: <output-dir>/.tfiam-cache)",
+        )
+        parser.add_argument(
+            "--rpm",
+            type=int,
+            default=None,
+            help="OpenAI requests per minute to stay under (default: 500)",
+        )
+        parser.add_argument(
+            "--tpm",
+            type=int,
+            default=None,
+            help="OpenAI tokens per minute to stay under (default: 60000)",
+        )
+        parser.add_argument(
+            "--batch",
+            action="store_true",
+            help="Submit AI explanations through the OpenAI Batch API (cheaper, slower)",
+        )
 
         args = parser.parse_args()
 
@@ -756,6 +788,10 @@ def main():
         clear_cache = args.no_cache
         output_dir = args.output_dir
         quiet = args.quiet
+        use_batch = args.batch
+        cache_dir = args.cache_dir
+        requests_per_minute = args.rpm
+        tokens_per_minute = args.tpm
 
     # Validate directory
     if not os.path.isdir(directory):
@@ -784,7 +820,7 @@ def main():
 
     # Display header unless in quiet mode
     if not quiet:
-        CyberCLI.print_header()
+        print_header()
         print(f"{CyberCLI.CYAN}🔍 Scanning Terraform directory: {directory}{CyberCLI.END}")
 
     # Create output directory
@@ -797,7 +833,7 @@ def main():
     if not quiet:
         print(f"{CyberCLI.CYAN}🔍 Scanning Terraform files...{CyberCLI.END}")
 
-    analyzer.scan_directory(directory)
+    analyzer.scan_directory(directory, tf_files)
 
     # Check if any resources were found
     if len(analyzer.resources) == 0:
@@ -835,70 +871,60 @@ def main():
                     f"{CyberCLI.GRAY}This may take a moment as we analyze each IAM statement.{CyberCLI.END}"
                 )
 
+            # Imported here so runs without AI never load the openai SDK
+            from tfiam import OpenAIAnalyzer
+
             openai_analyzer = OpenAIAnalyzer(
-                openai_key, cache_dir=os.path.join(output_dir, ".tfiam-cache")
+                openai_key,
+                cache_dir=cache_dir or os.path.join(output_dir, ".tfiam-cache"),
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
             )
 
             # Clear cache if requested
             if clear_cache:
                 if not quiet:
                     print(f"{CyberCLI.YELLOW}🗑️  Clearing AI cache...{CyberCLI.END}")
-                openai_analyzer.cache.clear()
+                openai_analyzer.clear_cache()
                 if not quiet:
                     print(f"{CyberCLI.GREEN}✅ Cache cleared{CyberCLI.END}")
 
-            # Process statements with progress tracking
-            if not quiet:
-                print(f"{CyberCLI.CYAN}📊 Processing statements:{CyberCLI.END}")
-
-            statements = openai_analyzer.enhance_statements_with_progress(statements, quiet)
-            openai_enabled = True
-
-            if not quiet:
-                print(
-                    f"\n{CyberCLI.GREEN}✅ Successfully enhanced {len(statements)} statements with AI explanations{CyberCLI.END}"
+            # Reuse the Terraform sources captured during the scan for verification
+            terraform_content = analyzer.get_combined_content()
+
+            # Verification doesn't depend on the explanations, so run it quietly in the
+            # background while statements are being enhanced. If enhancement fails, leaving
+            # the with block still waits for a verification request that is already in flight
+            with ThreadPoolExecutor(max_workers=1) as verification_executor:
+                verification_future = verification_executor.submit(
+                    openai_analyzer.verify_and_optimize_policy,
+                    statements,
+                    analyzer.resources,
+                    terraform_content,
+                    True,
                 )
-
-                # Display cache statistics
-                cache_stats = openai_analyzer.get_cache_stats()
-                if cache_stats["total_requests"] > 0:
-                    print(f"\n{CyberCLI.CYAN}📦 Cache Statistics:{CyberCLI.END}")
-                    print(
-                        f"  Cache hits: {cache_stats['cache_hits']} ({cache_stats['hit_rate']:.1f}%)"
-                    )
-                    print(f"  Cache misses: {cache_stats['cache_misses']}")
-                    print(f"  Total cached responses: {cache_stats['cache_size']}")
-                    if cache_stats["hit_rate"] > 0:
-                        print(
-                            f"  💰 Cost savings: ~${cache_stats['cache_hits'] * 0.002:.3f} (estimated)"
-                        )
-
-            # Perform policy verification and optimization
-            verification_result = None
-            try:
-                # Read all Terraform files to get combined content
-                terraform_content = ""
-                for tf_file in check_terraform_files(directory):
-                    file_path = os.path.join(directory, tf_file)
-                    try:
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            terraform_content += f.read() + "\n\n"
-                    except Exception:
-                        pass  # Skip files that can't be read
-
-                verification_result = openai_analyzer.verify_and_optimize_policy(
-                    statements, analyzer.resources, terraform_content, quiet
+                statements = _enhance_statements(
+                    openai_analyzer, statements, verification_future, use_batch, quiet
                 )
+                openai_enabled = True
 
-                if not quiet and verification_result:
-                    _display_verification_results(verification_result)
-
-            except Exception as e:
-                if not quiet:
-                    print(
-                        f"{CyberCLI.YELLOW}Warning: Policy verification failed: {e}{CyberCLI.END}"
-                    )
+                # Collect policy verification and optimization results
                 verification_result = None
+                try:
+                    if not quiet:
+                        print(
+                            f"\n{CyberCLI.MAGENTA}🔍 Cross-referencing policy with Terraform code...{CyberCLI.END}"
+                        )
+                    _wait_for_verification(verification_future, quiet)
+                    verification_result = verification_future.result()
+                    if not quiet and verification_result:
+                        _display_verification_results(verification_result)
+                except Exception as e:
+                    if not quiet:
+                        print(
+                            f"{CyberCLI.YELLOW}Warning: Policy verification failed: {e}{CyberCLI.END}"
+                        )
+                    verification_result = None
         except Exception as e:
             print(f"{CyberCLI.YELLOW}Warning: OpenAI enhancement failed: {e}{CyberCLI.END}")
             if not quiet:
@@ -907,6 +933,9 @@ def main():
     # Generate output filename - always use repository name
     json_filename = os.path.join(output_dir, "tf-ai-permissions.json")
 
+    # Statements are final from here on, so count their permissions once
+    permissions_count = sum(len(stmt.action) for stmt in statements)
+
     # Prepare metadata
     analysis_metadata = {
         "terraform_directory": directory,
@@ -914,7 +943,7 @@ def main():
         "services": list(analyzer.aws_services),
         "resources_count": len(analyzer.resources),
         "statements_count": len(statements),
-        "permissions_count": sum(len(stmt.action) for stmt in statements),
+        "permissions_count": permissions_count,
         "openai_enabled": openai_enabled,
     }
 
@@ -939,46 +968,56 @@ def main():
     if not quiet:
         print(f"{CyberCLI.CYAN}💾 Saving IAM policy to JSON...{CyberCLI.END}")
 
-    policy_size = PolicyGenerator.save_policy_clean(statements, analysis_metadata, json_filename)
+    # The policy and the report share no state, so write them concurrently
+    with ThreadPoolExecutor(max_workers=2) as output_executor:
+        policy_future = output_executor.submit(
+            PolicyGenerator.save_policy_clean, statements, analysis_metadata, json_filename
+        )
+
+        # Save markdown report if OpenAI was used
+        report_future = None
+        if openai_enabled:
+            if not quiet:
+                print(f"{CyberCLI.CYAN}📝 Generating detailed AI analysis report...{CyberCLI.END}")
+
+            md_filename = os.path.join(output_dir, "tf-ai-permissions-report.md")
+
+            # Include verification results in markdown report if available
+            enhanced_metadata = analysis_metadata.copy()
+            if "verification_result" in locals() and verification_result:
+                enhanced_metadata["verification_analysis"] = verification_result.get(
+                    "raw_analysis", ""
+                )
+                enhanced_metadata["verification_recommendations"] = verification_result.get(
+                    "recommendations", {}
+                )
+                enhanced_metadata["verification_passed"] = verification_result.get(
+                    "verification_passed", False
+                )
+                enhanced_metadata["policy_statistics"] = verification_result.get(
+                    "policy_statistics", {}
+                )
+                enhanced_metadata["terraform_statistics"] = verification_result.get(
+                    "terraform_statistics", {}
+                )
+
+            report_future = output_executor.submit(
+                PolicyGenerator.save_markdown_report, statements, enhanced_metadata, md_filename
+            )
 
-    # Save markdown report if OpenAI was used
     files_info = []
     files_info.append(
         {
             "name": os.path.basename(json_filename),
-            "size": policy_size,
+            "size": policy_future.result(),
             "description": "IAM Policy (JSON format)",
         }
     )
-
-    if openai_enabled:
-        if not quiet:
-            print(f"{CyberCLI.CYAN}📝 Generating detailed AI analysis report...{CyberCLI.END}")
-
-        md_filename = os.path.join(output_dir, "tf-ai-permissions-report.md")
-
-        # Include verification results in markdown report if available
-        enhanced_metadata = analysis_metadata.copy()
-        if "verification_result" in locals() and verification_result:
-            enhanced_metadata["verification_analysis"] = verification_result.get("raw_analysis", "")
-            enhanced_metadata["verification_recommendations"] = verification_result.get(
-                "recommendations", {}
-            )
-            enhanced_metadata["verification_passed"] = verification_result.get(
-                "verification_passed", False
-            )
-            enhanced_metadata["policy_statistics"] = verification_result.get(
-                "policy_statistics", {}
-            )
-            enhanced_metadata["terraform_statistics"] = verification_result.get(
-                "terraform_statistics", {}
-            )
-
-        md_size = PolicyGenerator.save_markdown_report(statements, enhanced_metadata, md_filename)
+    if report_future:
         files_info.append(
             {
                 "name": os.path.basename(md_filename),
-                "size": md_size,
+                "size": report_future.result(),
                 "description": "Detailed Analysis Report with Verification (Markdown)",
             }
         )
@@ -988,12 +1027,12 @@ def main():
         summary_stats = {
             "services_count": len(analyzer.aws_services),
             "statements_count": len(statements),
-            "permissions_count": sum(len(stmt.action) for stmt in statements),
+            "permissions_count": permissions_count,
             "output_files": len(files_info),
             "openai_enabled": openai_enabled,
             "files": files_info,
         }
-        CyberCLI.print_summary(summary_stats)
+        print_summary(summary_stats)
 
         # Add optimization prompt if AI was enabled
         if openai_enabled and "verification_result" in locals() and verification_result:
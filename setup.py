@@ -31,6 +31,7 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={"fast": ["orjson>=3.9", "h2>=4.0"]},
     entry_points={
         "console_scripts": [
             "tfiam=main:main",
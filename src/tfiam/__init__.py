@@ -9,9 +9,14 @@ __version__ = "1.0.0"
 __author__ = "TFIAM Team"
 __description__ = "Terraform IAM Permission Analyzer"
 
-from .cli.cyber_cli import CyberCLI, print_cyberpunk_help
+from .cli.cyber_cli import (
+    CyberCLI,
+    create_loading_spinner,
+    print_cyberpunk_help,
+    print_header,
+    print_summary,
+)
 from .core.analyzer import TerraformAnalyzer
-from .core.openai_analyzer import OpenAIAnalyzer
 from .core.policy_generator import PolicyGenerator
 
 __all__ = [
@@ -20,4 +25,16 @@ __all__ = [
     "OpenAIAnalyzer",
     "CyberCLI",
     "print_cyberpunk_help",
+    "print_header",
+    "print_summary",
+    "create_loading_spinner",
 ]
+
+
+def __getattr__(name):
+    """Import OpenAIAnalyzer on first use so the openai SDK is not loaded for non-AI runs."""
+    if name == "OpenAIAnalyzer":
+        from .core.openai_analyzer import OpenAIAnalyzer
+
+        return OpenAIAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,17 @@
 """CLI components for TFIAM."""
 
-from .cyber_cli import CyberCLI, print_cyberpunk_help
+from .cyber_cli import (
+    CyberCLI,
+    create_loading_spinner,
+    print_cyberpunk_help,
+    print_header,
+    print_summary,
+)
 
-__all__ = ["CyberCLI", "print_cyberpunk_help"]
+__all__ = [
+    "CyberCLI",
+    "create_loading_spinner",
+    "print_cyberpunk_help",
+    "print_header",
+    "print_summary",
+]
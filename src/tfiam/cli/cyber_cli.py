@@ -1,9 +1,120 @@
 """Cyberpunk-themed CLI interface for TFIAM."""
 
+import atexit
+import itertools
+import os
 import sys
 import threading
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+
+# Redirected output is already block-buffered, so banners only force a flush on a terminal
+_STDOUT_IS_TTY = sys.stdout is not None and sys.stdout.isatty()
+_STDOUT_ENCODING = getattr(sys.stdout, "encoding", None) or "utf-8"
+# Spinner frames on an interactive stdout go straight to its file descriptor
+_STDOUT_FD = sys.stdout.fileno() if _STDOUT_IS_TTY else None
+# Redirected output and NO_COLOR get plain ASCII banners without colour codes
+_PLAIN_OUTPUT = not _STDOUT_IS_TTY or bool(os.environ.get("NO_COLOR"))
+
+
+def _encode_block(text: str) -> Optional[bytes]:
+    """Pre-encode static output for stdout's byte buffer, or None if it cannot be encoded."""
+    try:
+        return text.replace("\n", os.linesep).encode(_STDOUT_ENCODING)
+    except (LookupError, UnicodeEncodeError):
+        return None
+
+
+def _write_block(text: str, encoded: Optional[bytes] = None) -> None:
+    """Write a block of output, flushing only when stdout is interactive."""
+    stdout = sys.stdout
+    buffer = getattr(stdout, "buffer", None)
+    if encoded is not None and buffer is not None and stdout.encoding == _STDOUT_ENCODING:
+        # Pre-encoded bytes skip the text encoder; earlier text must reach the buffer first
+        stdout.flush()
+        buffer.write(encoded)
+        if _STDOUT_IS_TTY:
+            buffer.flush()
+        return
+    stdout.write(text)
+    if _STDOUT_IS_TTY:
+        stdout.flush()
+
+
+class _SpinnerService:
+    """Single background thread that animates every active LoadingSpinner."""
+
+    TICK_SECONDS = 0.1
+    # Spinners younger than WARMUP_SECONDS tick faster so short-lived ones render promptly
+    WARMUP_TICK_SECONDS = 0.016
+    WARMUP_SECONDS = 0.1
+
+    def __init__(self):
+        self._active: List["LoadingSpinner"] = []
+        self._condition = threading.Condition()
+        # Set by register() and shutdown() to cut the current tick short
+        self._wake = threading.Event()
+        self._thread = None
+        self._closed = False
+
+    def register(self, spinner: "LoadingSpinner") -> None:
+        """Start animating a spinner, launching the service thread on first use."""
+        # Raw frame writes bypass the text buffer, so earlier output must go out first
+        sys.stdout.flush()
+        with self._condition:
+            self._active.append(spinner)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+                atexit.register(self.shutdown)
+            self._condition.notify()
+        self._wake.set()
+
+    def unregister(self, spinner: "LoadingSpinner") -> None:
+        """Stop animating a spinner; no frame for it is written after this returns."""
+        with self._condition:
+            if spinner in self._active:
+                self._active.remove(spinner)
+
+    def shutdown(self) -> None:
+        """Stop the service thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Write the next frame of each active spinner every tick."""
+        # Bound once; the loop runs for as long as any spinner is shown
+        active = self._active
+        condition = self._condition
+        wake_wait = self._wake.wait
+        wake_clear = self._wake.clear
+        monotonic = time.monotonic
+        tick, warmup_tick, warmup = self.TICK_SECONDS, self.WARMUP_TICK_SECONDS, self.WARMUP_SECONDS
+        while True:
+            with condition:
+                while not active and not self._closed:
+                    condition.wait()
+                if self._closed:
+                    return
+                stdout = sys.stdout
+                raw = _STDOUT_FD is not None and stdout is sys.__stdout__
+                for spinner in active:
+                    frame, encoded = next(spinner._frame_cycle)
+                    if raw and encoded is not None:
+                        os.write(_STDOUT_FD, encoded)
+                    else:
+                        stdout.write(frame)
+                        stdout.flush()
+                newest_start = max(spinner._started_at for spinner in active)
+            wake_wait(warmup_tick if monotonic() - newest_start < warmup else tick)
+            wake_clear()
+
+
+_spinner_service = _SpinnerService()
 
 
 class LoadingSpinner:
@@ -13,31 +124,68 @@ class LoadingSpinner:
         self.message = message
         self.color = color
         self.spinner_chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+        # Frames are formatted once so each animation tick is a plain write
+        self._frames = [
+            f"\r{color}{char} {message}...{CyberCLI.END}" for char in self.spinner_chars
+        ]
+        self._frame_cycle = itertools.cycle(
+            [(frame, _encode_block(frame)) for frame in self._frames]
+        )
+        self._started_at = 0.0
         self.running = False
-        self.thread = None
-
-    def _animate(self):
-        """Internal animation loop."""
-        i = 0
-        while self.running:
-            spinner = self.spinner_chars[i % len(self.spinner_chars)]
-            print(f"\r{self.color}{spinner} {self.message}...\033[0m", end="", flush=True)
-            i += 1
-            time.sleep(0.1)
 
     def start(self):
         """Start the loading animation."""
+        if self.running:
+            return  # Registering twice would draw every frame twice
         self.running = True
-        self.thread = threading.Thread(target=self._animate)
-        self.thread.daemon = True
-        self.thread.start()
+        if _PLAIN_OUTPUT:
+            # Logs and NO_COLOR terminals get the message once instead of \r frames
+            print(f"{self.message}...")
+            return
+        self._started_at = time.monotonic()
+        _spinner_service.register(self)
 
     def stop(self, success_message="✅ Complete!"):
         """Stop the loading animation and show completion message."""
         self.running = False
-        if self.thread:
-            self.thread.join()
-        print(f"\r\033[K{self.color}{success_message}\033[0m")  # Clear line and show completion
+        if _PLAIN_OUTPUT:
+            print(success_message)
+            return
+        _spinner_service.unregister(self)
+        # Clear line and show completion
+        print(f"\r\033[K{self.color}{success_message}{CyberCLI.END}")
+
+
+def create_loading_spinner(message="Loading", color=None) -> LoadingSpinner:
+    """Create a loading spinner with cyberpunk styling."""
+    if color is None:
+        color = CyberCLI.CYAN
+    return LoadingSpinner(message, color)
+
+
+def print_header():
+    """Print the IAM header."""
+    _write_block(_HEADER_BANNER, _HEADER_BANNER_BYTES)
+
+
+def print_ai_processing():
+    """Print the AI processing banner without pausing for an animation."""
+    print(f"\n{CyberCLI.MAGENTA}🤖 AI Processing...{CyberCLI.END}")
+    print(f"{CyberCLI.GREEN}✓ AI analysis complete!{CyberCLI.END}")
+
+
+def print_summary(stats: Dict[str, Any]):
+    """Print final summary."""
+    ai_status = _AI_STATUS_LABELS[bool(stats.get("openai_enabled", False))]
+    parts = [_SUMMARY_TEMPLATE % {**stats, "ai_status": ai_status}]
+    file_template = _SUMMARY_FILE_TEMPLATE
+    parts.extend(
+        file_template % (file_info["name"], file_info["size"] / 1024, file_info["description"])
+        for file_info in stats["files"]
+    )
+    parts.append(_SUMMARY_FOOTER)
+    _write_block("".join(parts))
 
 
 class CyberCLI:
@@ -55,136 +203,167 @@ class CyberCLI:
     BOLD = "\033[1m"
     END = "\033[0m"
 
-    @staticmethod
-    def create_loading_spinner(message="Loading", color=None):
-        """Create a loading spinner with cyberpunk styling."""
-        if color is None:
-            color = CyberCLI.CYAN
-        return LoadingSpinner(message, color)
-
-    @staticmethod
-    def print_header():
-        """Print the IAM header."""
-        print(f"{CyberCLI.CYAN}{CyberCLI.BOLD}")
-        print("╔══════════════════════════════════════════════════════════════════════════════╗")
-        print("║                                                                              ║")
-        print("║                           ██╗ █████╗ ███╗   ███╗                             ║")
-        print("║                           ██║██╔══██╗████╗ ████║                             ║")
-        print("║                           ██║███████║██╔████╔██║                             ║")
-        print("║                           ██║██╔══██║██║╚██╔╝██║                             ║")
-        print("║                           ██║██║  ██║██║ ╚═╝ ██║                             ║")
-        print("║                           ╚═╝╚═╝  ╚═╝╚═╝     ╚═╝                             ║")
-        print("║                                                                              ║")
-        print(
-            f"║         🌐 \033[3m\033[96mTERRAFORM ASSUME ROLE IAM ANALYZER\033[0m 🌐                             ║"
-        )
-        print("║                                                                              ║")
-        print("║                                                                              ║")
-        print("╚══════════════════════════════════════════════════════════════════════════════╝")
-        print(f"{CyberCLI.END}\n")
-
-    @staticmethod
-    def print_ai_processing():
-        """Print AI processing animation."""
-        import sys
-        import time
-
-        print(f"\n{CyberCLI.MAGENTA}🤖 AI Processing...{CyberCLI.END}")
-
-        # Simple loading animation
-        for i in range(3):
-            for char in ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]:
-                sys.stdout.write(
-                    f"\r{CyberCLI.CYAN}{char} Analyzing statements with OpenAI...{CyberCLI.END}"
-                )
-                sys.stdout.flush()
-                time.sleep(0.1)
-
-        print(f"\r{CyberCLI.GREEN}✓ AI analysis complete!{CyberCLI.END}")
-
-    @staticmethod
-    def print_summary(stats: Dict[str, Any]):
-        """Print final summary."""
-        print(
-            f"\n{CyberCLI.GREEN}{CyberCLI.BOLD}╔══════════════════════════════════════════════════════════════════════════════╗{CyberCLI.END}"
-        )
-        print(
-            f"{CyberCLI.GREEN}{CyberCLI.BOLD}║                           {CyberCLI.WHITE}ANALYSIS COMPLETE{CyberCLI.GREEN}                           ║{CyberCLI.END}"
-        )
-        print(
-            f"{CyberCLI.GREEN}{CyberCLI.BOLD}╠══════════════════════════════════════════════════════════════════════════════╣{CyberCLI.END}"
-        )
-        print(
-            f"{CyberCLI.GREEN}{CyberCLI.BOLD}║                                                                              ║{CyberCLI.END}"
-        )
-        print(
-            f"{CyberCLI.GREEN}{CyberCLI.BOLD}║  {CyberCLI.WHITE}Services Analyzed:     {CyberCLI.CYAN}{stats['services_count']:>3}{CyberCLI.GREEN}                                    ║{CyberCLI.END}"
-        )
-        print(
-            f"{CyberCLI.GREEN}{CyberCLI.BOLD}║  {CyberCLI.WHITE}IAM Statements:        {CyberCLI.CYAN}{stats['statements_count']:>3}{CyberCLI.GREEN}                                    ║{CyberCLI.END}"
-        )
-        print(
-            f"{CyberCLI.GREEN}{CyberCLI.BOLD}║  {CyberCLI.WHITE}Total Permissions:     {CyberCLI.CYAN}{stats['permissions_count']:>3}{CyberCLI.GREEN}                                    ║{CyberCLI.END}"
-        )
-        print(
-            f"{CyberCLI.GREEN}{CyberCLI.BOLD}║  {CyberCLI.WHITE}Output Files:          {CyberCLI.CYAN}{stats['output_files']:>3}{CyberCLI.GREEN}                                    ║{CyberCLI.END}"
-        )
-        ai_status = "✓ Enabled" if stats.get("openai_enabled", False) else "✗ Disabled"
-        print(
-            f"{CyberCLI.GREEN}{CyberCLI.BOLD}║  {CyberCLI.WHITE}AI Analysis:           {CyberCLI.CYAN}{ai_status:<10}{CyberCLI.GREEN}                                    ║{CyberCLI.END}"
-        )
-        print(
-            f"{CyberCLI.GREEN}{CyberCLI.BOLD}║                                                                              ║{CyberCLI.END}"
-        )
-        print(
-            f"{CyberCLI.GREEN}{CyberCLI.BOLD}╚══════════════════════════════════════════════════════════════════════════════╝{CyberCLI.END}"
-        )
+    # Kept for callers that use the class as a namespace
+    create_loading_spinner = staticmethod(create_loading_spinner)
+    print_header = staticmethod(print_header)
+    print_ai_processing = staticmethod(print_ai_processing)
+    print_summary = staticmethod(print_summary)
 
-        print(f"\n{CyberCLI.CYAN}{CyberCLI.BOLD}📁 OUTPUT FILES:{CyberCLI.END}")
-        for file_info in stats["files"]:
-            size_kb = file_info["size"] / 1024
-            print(
-                f"{CyberCLI.YELLOW}├─{CyberCLI.END} {CyberCLI.WHITE}{file_info['name']}{CyberCLI.END} {CyberCLI.CYAN}({size_kb:.1f}KB){CyberCLI.END}"
-            )
-            print(f"{CyberCLI.YELLOW}│  {CyberCLI.GRAY}→ {file_info['description']}{CyberCLI.END}")
 
-        print(
-            f"\n{CyberCLI.GREEN}{CyberCLI.BOLD}✅ Mission Complete! Your IAM policies are ready for deployment.{CyberCLI.END}\n"
-        )
+if _PLAIN_OUTPUT:
+    # Messages built from these constants elsewhere come out uncoloured too
+    for _name in [name for name in vars(CyberCLI) if name.isupper()]:
+        setattr(CyberCLI, _name, "")
+
+# Static banners are rendered once at import instead of on every call
+_HEADER_BANNER = (
+    "\n".join(
+        [
+            f"{CyberCLI.CYAN}{CyberCLI.BOLD}",
+            "╔══════════════════════════════════════════════════════════════════════════════╗",
+            "║                                                                              ║",
+            "║                           ██╗ █████╗ ███╗   ███╗                             ║",
+            "║                           ██║██╔══██╗████╗ ████║                             ║",
+            "║                           ██║███████║██╔████╔██║                             ║",
+            "║                           ██║██╔══██║██║╚██╔╝██║                             ║",
+            "║                           ██║██║  ██║██║ ╚═╝ ██║                             ║",
+            "║                           ╚═╝╚═╝  ╚═╝╚═╝     ╚═╝                             ║",
+            "║                                                                              ║",
+            f"║         🌐 \033[3m\033[96mTERRAFORM ASSUME ROLE IAM ANALYZER\033[0m 🌐                             ║",
+            "║                                                                              ║",
+            "║                                                                              ║",
+            "╚══════════════════════════════════════════════════════════════════════════════╝",
+            f"{CyberCLI.END}\n",
+        ]
+    )
+    + "\n"
+)
+
+_HELP_BANNER = (
+    "\n".join(
+        [
+            f"{CyberCLI.CYAN}{CyberCLI.BOLD}",
+            "╔══════════════════════════════════════════════════════════════════════════════╗",
+            "║                           🌐 TFIAM HELP MATRIX 🌐                          ║",
+            "╠══════════════════════════════════════════════════════════════════════════════╣",
+            "║                                                                              ║",
+            "║  USAGE:                                                                      ║",
+            "║    tfiam <directory> [OPTIONS]                                              ║",
+            "║                                                                              ║",
+            "║  ARGUMENTS:                                                                  ║",
+            "║    directory          Path to Terraform repository                          ║",
+            "║                                                                              ║",
+            "║  OPTIONS:                                                                   ║",
+            "║    --ai               Enable AI explanations + verification & optimization ║",
+            "║    --no-ai            Skip AI analysis (default)                           ║",
+            "║    --output-dir DIR   Output directory (default: tfiam-output)              ║",
+            "║    --quiet, -q        Minimal output                                       ║",
+            "║    --no-cache         Clear AI cache and generate fresh analysis           ║",
+            "║    --cache-dir DIR    Directory for cached AI responses                    ║",
+            "║    --rpm N            OpenAI requests per minute limit (default: 500)      ║",
+            "║    --tpm N            OpenAI tokens per minute limit (default: 60000)      ║",
+            "║    --batch            Use the OpenAI Batch API for explanations (cheaper)  ║",
+            "║    --help, -h         Show this help message                               ║",
+            "║                                                                              ║",
+            "║  INTERACTIVE MODE:                                                          ║",
+            "║    Run without arguments for guided setup                                  ║",
+            "║                                                                              ║",
+            "║  EXAMPLES:                                                                  ║",
+            "║    python main.py                                                           ║",
+            "║    python main.py ./my-terraform --ai                                       ║",
+            "║    python main.py ./infra --no-ai --output-dir policies                     ║",
+            "║    python main.py ./infra --ai --no-cache                                   ║",
+            "║                                                                              ║",
+            "║  🌟 TFIAM analyzes Terraform files and generates IAM policies with        ║",
+            "║     AI-powered explanations, verification & optimization!                   ║",
+            "║                                                                              ║",
+            "╚══════════════════════════════════════════════════════════════════════════════╝",
+            f"{CyberCLI.END}",
+        ]
+    )
+    + "\n"
+)
+
+# The summary frame is formatted once; print_summary only fills in the stats
+_SUMMARY_FRAME = f"{CyberCLI.GREEN}{CyberCLI.BOLD}"
+_SUMMARY_TEMPLATE_COLOR = (
+    f"\n{_SUMMARY_FRAME}╔══════════════════════════════════════════════════════════════════════════════╗{CyberCLI.END}\n"
+    f"{_SUMMARY_FRAME}║                           {CyberCLI.WHITE}ANALYSIS COMPLETE{CyberCLI.GREEN}                           ║{CyberCLI.END}\n"
+    f"{_SUMMARY_FRAME}╠══════════════════════════════════════════════════════════════════════════════╣{CyberCLI.END}\n"
+    f"{_SUMMARY_FRAME}║                                                                              ║{CyberCLI.END}\n"
+    f"{_SUMMARY_FRAME}║  {CyberCLI.WHITE}Services Analyzed:     {CyberCLI.CYAN}%(services_count)3s{CyberCLI.GREEN}                                    ║{CyberCLI.END}\n"
+    f"{_SUMMARY_FRAME}║  {CyberCLI.WHITE}IAM Statements:        {CyberCLI.CYAN}%(statements_count)3s{CyberCLI.GREEN}                                    ║{CyberCLI.END}\n"
+    f"{_SUMMARY_FRAME}║  {CyberCLI.WHITE}Total Permissions:     {CyberCLI.CYAN}%(permissions_count)3s{CyberCLI.GREEN}                                    ║{CyberCLI.END}\n"
+    f"{_SUMMARY_FRAME}║  {CyberCLI.WHITE}Output Files:          {CyberCLI.CYAN}%(output_files)3s{CyberCLI.GREEN}                                    ║{CyberCLI.END}\n"
+    f"{_SUMMARY_FRAME}║  {CyberCLI.WHITE}AI Analysis:           {CyberCLI.CYAN}%(ai_status)-10s{CyberCLI.GREEN}                                    ║{CyberCLI.END}\n"
+    f"{_SUMMARY_FRAME}║                                                                              ║{CyberCLI.END}\n"
+    f"{_SUMMARY_FRAME}╚══════════════════════════════════════════════════════════════════════════════╝{CyberCLI.END}\n"
+    f"\n{CyberCLI.CYAN}{CyberCLI.BOLD}📁 OUTPUT FILES:{CyberCLI.END}\n"
+)
+_SUMMARY_FILE_TEMPLATE_COLOR = (
+    f"{CyberCLI.YELLOW}├─{CyberCLI.END} {CyberCLI.WHITE}%s{CyberCLI.END} {CyberCLI.CYAN}(%.1fKB){CyberCLI.END}\n"
+    f"{CyberCLI.YELLOW}│  {CyberCLI.GRAY}→ %s{CyberCLI.END}\n"
+)
+_SUMMARY_FOOTER_COLOR = f"\n{_SUMMARY_FRAME}✅ Mission Complete! Your IAM policies are ready for deployment.{CyberCLI.END}\n\n"
+
+
+# Redirected output and NO_COLOR get plain ASCII without escape codes
+_HEADER_BANNER_PLAIN = (
+    "\n+" + "-" * 78 + "+\n"
+    "|" + " " * 78 + "|\n"
+    "|" + "I A M".center(78) + "|\n"
+    "|" + " " * 78 + "|\n"
+    "|" + "TERRAFORM ASSUME ROLE IAM ANALYZER".center(78) + "|\n"
+    "|" + " " * 78 + "|\n"
+    "+" + "-" * 78 + "+\n\n"
+)
+# Box drawing and emoji in the help banner map to ASCII of the same display width
+_ASCII_BANNER_CHARS = str.maketrans(
+    {
+        "╔": "+",
+        "╗": "+",
+        "╚": "+",
+        "╝": "+",
+        "╠": "+",
+        "╣": "+",
+        "═": "-",
+        "║": "|",
+        "🌐": "**",
+        "🌟": "**",
+    }
+)
+_SUMMARY_TEMPLATE_PLAIN = (
+    "\n+" + "-" * 78 + "+\n"
+    "|" + "ANALYSIS COMPLETE".center(78) + "|\n"
+    "+" + "-" * 78 + "+\n"
+    "|  Services Analyzed:     %(services_count)3s" + " " * 50 + "|\n"
+    "|  IAM Statements:        %(statements_count)3s" + " " * 50 + "|\n"
+    "|  Total Permissions:     %(permissions_count)3s" + " " * 50 + "|\n"
+    "|  Output Files:          %(output_files)3s" + " " * 50 + "|\n"
+    "|  AI Analysis:           %(ai_status)-10s" + " " * 43 + "|\n"
+    "+" + "-" * 78 + "+\n"
+    "\nOUTPUT FILES:\n"
+)
+_SUMMARY_FILE_TEMPLATE_PLAIN = "|- %s (%.1fKB)\n|  -> %s\n"
+_SUMMARY_FOOTER_PLAIN = "\nMission Complete! Your IAM policies are ready for deployment.\n\n"
+
+if _PLAIN_OUTPUT:
+    _HEADER_BANNER = _HEADER_BANNER_PLAIN
+    _HELP_BANNER = _HELP_BANNER.translate(_ASCII_BANNER_CHARS)
+    _AI_STATUS_LABELS = ("Disabled", "Enabled")
+    _SUMMARY_TEMPLATE = _SUMMARY_TEMPLATE_PLAIN
+    _SUMMARY_FILE_TEMPLATE = _SUMMARY_FILE_TEMPLATE_PLAIN
+    _SUMMARY_FOOTER = _SUMMARY_FOOTER_PLAIN
+else:
+    _AI_STATUS_LABELS = ("✗ Disabled", "✓ Enabled")
+    _SUMMARY_TEMPLATE = _SUMMARY_TEMPLATE_COLOR
+    _SUMMARY_FILE_TEMPLATE = _SUMMARY_FILE_TEMPLATE_COLOR
+    _SUMMARY_FOOTER = _SUMMARY_FOOTER_COLOR
+
+_HEADER_BANNER_BYTES = _encode_block(_HEADER_BANNER)
+_HELP_BANNER_BYTES = _encode_block(_HELP_BANNER)
 
 
 def print_cyberpunk_help():
     """Print cyberpunk-themed help message."""
-    print(f"{CyberCLI.CYAN}{CyberCLI.BOLD}")
-    print("╔══════════════════════════════════════════════════════════════════════════════╗")
-    print("║                           🌐 TFIAM HELP MATRIX 🌐                          ║")
-    print("╠══════════════════════════════════════════════════════════════════════════════╣")
-    print("║                                                                              ║")
-    print("║  USAGE:                                                                      ║")
-    print("║    tfiam <directory> [OPTIONS]                                              ║")
-    print("║                                                                              ║")
-    print("║  ARGUMENTS:                                                                  ║")
-    print("║    directory          Path to Terraform repository                          ║")
-    print("║                                                                              ║")
-    print("║  OPTIONS:                                                                   ║")
-    print("║    --ai               Enable AI explanations + verification & optimization ║")
-    print("║    --no-ai            Skip AI analysis (default)                           ║")
-    print("║    --output-dir DIR   Output directory (default: tfiam-output)              ║")
-    print("║    --quiet, -q        Minimal output                                       ║")
-    print("║    --no-cache         Clear AI cache and generate fresh analysis           ║")
-    print("║    --help, -h         Show this help message                               ║")
-    print("║                                                                              ║")
-    print("║  INTERACTIVE MODE:                                                          ║")
-    print("║    Run without arguments for guided setup                                  ║")
-    print("║                                                                              ║")
-    print("║  EXAMPLES:                                                                  ║")
-    print("║    python main.py                                                           ║")
-    print("║    python main.py ./my-terraform --ai                                       ║")
-    print("║    python main.py ./infra --no-ai --output-dir policies                     ║")
-    print("║    python main.py ./infra --ai --no-cache                                   ║")
-    print("║                                                                              ║")
-    print("║  🌟 TFIAM analyzes Terraform files and generates IAM policies with        ║")
-    print("║     AI-powered explanations, verification & optimization!                   ║")
-    print("║                                                                              ║")
-    print("╚══════════════════════════════════════════════════════════════════════════════╝")
-    print(f"{CyberCLI.END}")
+    _write_block(_HELP_BANNER, _HELP_BANNER_BYTES)
@@ -2,7 +2,6 @@
 
 from .analyzer import TerraformAnalyzer
 from .models import IAMStatement, TerraformResource
-from .openai_analyzer import OpenAIAnalyzer
 from .policy_generator import PolicyGenerator
 
 __all__ = [
@@ -12,3 +11,12 @@ __all__ = [
     "IAMStatement",
     "TerraformResource",
 ]
+
+
+def __getattr__(name):
+    """Import OpenAIAnalyzer on first use so the openai SDK is not loaded for non-AI runs."""
+    if name == "OpenAIAnalyzer":
+        from .openai_analyzer import OpenAIAnalyzer
+
+        return OpenAIAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
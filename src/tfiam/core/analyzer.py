@@ -2,195 +2,700 @@
 
 import os
 import re
-from collections import Counter
-from typing import Dict, List, Optional, Set, Union
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 from ..utils.arn_builder import ARNBuilder
 from ..utils.aws_permissions import AWS_PERMISSIONS
 from .models import IAMStatement, TerraformResource
 
+# Block and reference patterns, compiled once rather than looked up per file and per value
+_RESOURCE_BLOCK_RE = re.compile(
+    r'resource\s+["\']([^"\']+)["\']\s+["\']([^"\']+)["\']\s*\{', re.MULTILINE
+)
+# Only the header is matched; the body is found by brace counting so nested blocks such as
+# validation {} or object({...}) types neither end it early nor cause regex backtracking
+_VARIABLE_HEADER_RE = re.compile(r'variable\s+["\']([^"\']+)["\']\s*\{')
+_VARIABLE_DEFAULT_RE = re.compile(r"default\s*=\s*([^\n]+)")
+_LOCALS_BLOCK_RE = re.compile(r"locals\s*\{(.*?)\n\}", re.MULTILINE | re.DOTALL)
+_INTERPOLATION_RE = re.compile(r"\$\{([^}]+)\}")
+# Everything up to the first = outside quotes. A quote directly after a backslash neither
+# opens nor closes a string, and an unterminated string means there is no such =
+_UNQUOTED_EQUALS_RE = re.compile(
+    r"(?:[^\"'=]|(?<=\\)[\"']"
+    r'|(?<!\\)"(?:[^"]|(?<=\\)")*(?<!\\)"'
+    r"|(?<!\\)'(?:[^']|(?<=\\)')*(?<!\\)')*="
+)
+# Interpolated references whose value is unknown until apply time
+_WILDCARD_REFERENCE_KINDS = frozenset({"random_id", "each"})
+# Bare var.name and local.name references, resolved together in one substitution pass
+_SIMPLE_REF_RE = re.compile(r"(?:var|local)\.[a-zA-Z_][a-zA-Z0-9_]*")
+
+# Block headers of every kind, so each file is swept once instead of once per block kind
+_BLOCK_HEADER_RE = re.compile(
+    r'(?P<variable>variable\s+["\'](?P<variable_name>[^"\']+)["\']\s*\{)'
+    r"|(?P<locals>locals\s*\{)"
+    r'|(?P<resource>resource\s+["\'](?P<resource_type>[^"\']+)["\']\s+'
+    r'["\'](?P<resource_name>[^"\']+)["\']\s*\{)'
+)
+
+
+# Static lookup tables, built once at import rather than on every call
+_SERVICE_MAPPING: Mapping[str, str] = MappingProxyType(
+    {
+        # EC2 and related
+        "vpc": "ec2",
+        "subnet": "ec2",
+        "instance": "ec2",
+        "security": "ec2",
+        "internet": "ec2",
+        "network": "ec2",
+        "volume": "ec2",
+        "launch": "ec2",
+        "transit": "ec2",
+        "nat": "ec2",
+        "route": "ec2",
+        "client": "ec2",
+        "elastic": "ec2",
+        "dhcp": "ec2",
+        "egress": "ec2",
+        "image": "ec2",
+        "prefix": "ec2",
+        "account": "ec2",
+        # Other services
+        "db": "rds",
+        "rds": "rds",
+        "cloudwatch": "cloudwatch",
+        "logs": "logs",
+        "log": "logs",
+        "lambda": "lambda",
+        "route53": "route53",
+        "iam": "iam",
+        "s3": "s3",
+        "waf": "wafv2",
+        "wafv2": "wafv2",
+        "cloudfront": "cloudfront",
+        "eks": "eks",
+        "dynamodb": "dynamodb",
+        "dynamo": "dynamodb",
+        "elasticache": "elasticache",
+        "redis": "elasticache",
+        "api": "apigateway",
+        "apigateway": "apigateway",
+        "states": "states",
+        "sfn": "states",
+        "step": "states",
+        "ecr": "ecr",
+        "ecs": "ecs",
+        "lb": "elasticloadbalancing",
+        "load": "elasticloadbalancing",
+        "target": "elasticloadbalancing",
+        "listener": "elasticloadbalancing",
+        "events": "events",
+        "event": "events",
+        "firehose": "firehose",
+        "fis": "fis",
+        "guardduty": "guardduty",
+        "kms": "kms",
+        "organizations": "organizations",
+        "org": "organizations",
+        "secrets": "secretsmanager",
+        "secret": "secretsmanager",
+        "securityhub": "securityhub",
+        "security_hub": "securityhub",
+        "servicediscovery": "servicediscovery",
+        "service_discovery": "servicediscovery",
+        "signer": "signer",
+        "sns": "sns",
+        "sqs": "sqs",
+        "ssm": "ssm",
+        "parameter": "ssm",
+        "sts": "sts",
+        "transfer": "transfer",
+        "acm": "acm",
+        "certificate": "acm",
+        "airflow": "airflow",
+        "mwaa": "airflow",
+        "application_autoscaling": "application-autoscaling",
+        "app_autoscaling": "application-autoscaling",
+        "autoscaling": "autoscaling",
+        "asg": "autoscaling",
+        "backup": "backup",
+        "chatbot": "chatbot",
+        "cloudformation": "cloudformation",
+        "cfn": "cloudformation",
+        "cloudtrail": "cloudtrail",
+        "trail": "cloudtrail",
+        "cognito": "cognito-idp",
+        "user_pool": "cognito-idp",
+    }
+)
+
+# Property holding the actual resource name, per resource type
+_RESOURCE_NAME_PROPERTIES: Mapping[str, str] = MappingProxyType(
+    {
+        "aws_s3_bucket": "bucket",
+        "aws_iam_role": "name",
+        "aws_iam_policy": "name",
+        "aws_iam_user": "name",
+        "aws_lambda_function": "function_name",
+        "aws_rds_instance": "identifier",
+        "aws_rds_subnet_group": "name",
+        "aws_cloudwatch_log_group": "name",
+        "aws_cloudwatch_metric_alarm": "alarm_name",
+        "aws_vpc": "name",  # VPC doesn't have a name property, but let's check
+        "aws_subnet": "name",  # Subnet doesn't have a name property, but let's check
+        "aws_security_group": "name",  # Security group doesn't have a name property, but let's check
+        "aws_internet_gateway": "name",  # IGW doesn't have a name property, but let's check
+        "aws_route53_zone": "name",
+        "aws_route53_record": "name",
+        "aws_cloudfront_distribution": "name",  # CloudFront doesn't have a name property
+        "aws_wafv2_web_acl": "name",
+        "aws_eks_cluster": "name",
+        "aws_dynamodb_table": "name",
+        "aws_elasticache_replication_group": "name",  # Actually "replication_group_id"
+        "aws_api_gateway_rest_api": "name",
+        "aws_api_gateway_resource": "name",  # Actually "path_part"
+        "aws_api_gateway_method": "name",  # Actually "http_method"
+        "aws_sfn_state_machine": "name",
+    }
+)
+
+# S3 bucket configuration resources, which add to the bucket's statement instead of their own
+_S3_CONFIGURATION_TYPES = frozenset(
+    {
+        "aws_s3_bucket_versioning",
+        "aws_s3_bucket_server_side_encryption_configuration",
+        "aws_s3_bucket_policy",
+        "aws_s3_bucket_cors_configuration",
+        "aws_s3_bucket_website_configuration",
+        "aws_s3_bucket_acl",
+        "aws_s3_bucket_lifecycle_configuration",
+        "aws_s3_bucket_logging",
+        "aws_s3_bucket_notification",
+        "aws_s3_bucket_public_access_block",
+        "aws_s3_bucket_object_lock_configuration",
+        "aws_s3_bucket_replication_configuration",
+    }
+)
+
+# Resource types without a name property, so ARNs fall back to wildcards
+_UNNAMED_RESOURCE_TYPES = frozenset(
+    {"aws_vpc", "aws_subnet", "aws_security_group", "aws_internet_gateway"}
+)
+
+# Substrings of a bucket's stringified properties that signal each S3 feature
+_S3_FEATURE_INDICATORS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "versioning": ("versioning",),
+        "policy": ("policy", "bucket_policy"),
+        "cors": ("cors_rule", "cors_configuration"),
+        "website": ("website", "website_configuration", "website_endpoint"),
+        "acl": ("acl", "access_control_list"),
+        "encryption": ("encryption", "server_side_encryption", "sse"),
+        "lifecycle": ("lifecycle", "lifecycle_rule", "lifecycle_configuration"),
+        "logging": ("logging", "access_logging", "log_bucket"),
+        "public_access": ("public_access_block", "block_public_acls"),
+        "object_lock": ("object_lock", "object_lock_configuration"),
+        "replication": ("replication", "replication_configuration"),
+    }
+)
+# One lookahead alternative per feature, so a single scan reports every feature even where
+# indicators overlap (e.g. the "acl" inside "block_public_acls")
+_S3_FEATURE_RE = re.compile(
+    "(?=%s)"
+    % "|".join(
+        f"(?P<{feature}>{'|'.join(map(re.escape, indicators))})"
+        for feature, indicators in _S3_FEATURE_INDICATORS.items()
+    )
+)
+_CORS_PROPERTIES = ("allowed_headers", "allowed_methods", "allowed_origins", "max_age_seconds")
+_LIFECYCLE_PROPERTIES = (
+    "noncurrent_days",
+    "noncurrent_version_expiration",
+    "transition",
+    "expiration",
+)
+
+
+def _s3_features(properties: Dict) -> Set[str]:
+    """Return the S3 features mentioned anywhere in a resource's properties."""
+    return {match.lastgroup for match in _S3_FEATURE_RE.finditer(str(properties).lower())}
+
+
+@lru_cache(maxsize=None)
+def _titled(word: str) -> str:
+    """Title-case a service or resource type name for statement SIDs."""
+    return word.title()
+
+
+@lru_cache(maxsize=None)
+def _generic_permissions(aws_service: str, resource_type: str) -> tuple:
+    """Generate generic permissions for unknown AWS services."""
+    service_prefix = aws_service.lower()
+
+    # Common permission patterns across AWS services
+    generic_permissions = [
+        f"{service_prefix}:Create{resource_type.title()}",
+        f"{service_prefix}:Delete{resource_type.title()}",
+        f"{service_prefix}:Describe{resource_type.title()}",
+        f"{service_prefix}:List{resource_type.title()}",
+        f"{service_prefix}:Get{resource_type.title()}",
+        f"{service_prefix}:Update{resource_type.title()}",
+        f"{service_prefix}:Modify{resource_type.title()}",
+        f"{service_prefix}:Put{resource_type.title()}",
+        f"{service_prefix}:Tag{resource_type.title()}",
+        f"{service_prefix}:Untag{resource_type.title()}",
+        f"{service_prefix}:ListTagsFor{resource_type.title()}",
+    ]
+
+    # Add service-wide permissions
+    service_permissions = [
+        f"{service_prefix}:Describe*",
+        f"{service_prefix}:List*",
+        f"{service_prefix}:Get*",
+    ]
+
+    # Combine and return
+    all_permissions = generic_permissions + service_permissions
+    return tuple(sorted(all_permissions))
+
+
+# Windows opens descriptors in text mode unless asked otherwise
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+def _read_file_bytes(file_path: str) -> bytes:
+    """Read a whole file with raw os.read calls, skipping the buffered file object setup."""
+    fd = os.open(file_path, os.O_RDONLY | _O_BINARY)
+    try:
+        # Sized from fstat so a regular file comes back in one read; loop in case it grew
+        chunks = [os.read(fd, os.fstat(fd).st_size + 1)]
+        while chunks[-1]:
+            chunks.append(os.read(fd, 65536))
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+# Variable defaults, locals, and (type, name, properties) for each AWS resource in one file
+_ParsedBlocks = Tuple[Dict[str, str], Dict[str, str], List[Tuple[str, str, Dict[str, str]]]]
+
+
+def _parse_variable_block(name: str, body: str) -> Dict[str, str]:
+    """Return the default value of a variable block, if it has one."""
+    default_match = _VARIABLE_DEFAULT_RE.search(body)
+    if not default_match:
+        return {}
+    return {f"var.{name}": default_match.group(1).strip().strip("\"'")}
+
+
+def _parse_locals_block(locals_content: str) -> Dict[str, str]:
+    """Parse each definition in the body of a locals block."""
+    parsed: Dict[str, str] = {}
+    # Parse each local definition more carefully
+    lines = locals_content.split("\n")
+    current_local = None
+    current_value = []
+    brace_count = 0
+    # One scan of the whole block; flat locals need no per-line brace counting at all
+    has_braces = "{" in locals_content or "}" in locals_content
+
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+
+        # Count braces to handle nested structures
+        if has_braces:
+            brace_count += stripped.count("{") - stripped.count("}")
+
+        # Check for new local definition (at brace level 0)
+        if brace_count == 0 and "=" in stripped:
+            # Save previous local if exists
+            if current_local and current_value:
+                full_value = "\n".join(current_value).strip().strip("\"'")
+                if full_value.endswith(","):
+                    full_value = full_value[:-1]
+                parsed[f"local.{current_local}"] = full_value
+
+            # Parse new local
+            eq_pos = stripped.find("=")
+            if eq_pos > 0:
+                current_local = stripped[:eq_pos].strip()
+                value_part = stripped[eq_pos + 1 :].strip()
+                current_value = [value_part]
+                if has_braces:
+                    brace_count += value_part.count("{") - value_part.count("}")
+        else:
+            # Continue current local value
+            if current_local:
+                current_value.append(stripped)
+
+    # Save last local
+    if current_local and current_value:
+        full_value = "\n".join(current_value).strip().strip("\"'")
+        if full_value.endswith(","):
+            full_value = full_value[:-1]
+        parsed[f"local.{current_local}"] = full_value
+
+    return parsed
+
+
+def _block_body(content: str, start_pos: int) -> Optional[str]:
+    """Return the body of the block opened just before start_pos, or None if it never closes."""
+    # Jump between braces with str.find rather than stepping through every character
+    brace_count = 1
+    pos = start_pos
+    next_open = content.find("{", pos)
+
+    while True:
+        close = content.find("}", pos)
+        if close < 0:
+            # Malformed block
+            return None
+        while 0 <= next_open < close:
+            brace_count += 1
+            next_open = content.find("{", next_open + 1)
+        brace_count -= 1
+        if brace_count == 0:
+            return content[start_pos:close]
+        pos = close + 1
+
+
+def _find_unquoted_equals(line: str) -> int:
+    """Return the index of the first = outside quotes in line, or -1 if there is none."""
+    match = _UNQUOTED_EQUALS_RE.match(line)
+    return match.end() - 1 if match else -1
+
+
+def _parse_resource_properties(content: str) -> Dict[str, str]:
+    """Extract key-value pairs from resource content with better parsing."""
+    properties = {}
+
+    # More sophisticated parsing that handles complex Terraform syntax
+    lines = content.split("\n")
+    current_key = None
+    current_value = []
+    brace_count = 0
+
+    for line in lines:
+        # Outside a nested value only key = value lines matter, so skip the rest unstripped
+        if brace_count == 0 and "=" not in line:
+            continue
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        # Handle multi-line values and nested structures
+        if brace_count > 0:
+            current_value.append(line)
+            brace_count += line.count("{") - line.count("}")
+            if brace_count == 0:
+                # End of nested structure
+                if current_key:
+                    value_str = "\n".join(current_value).strip()
+                    properties[current_key] = value_str
+                    current_key = None
+                    current_value = []
+            continue
+
+        # Handle key-value pairs
+        if "=" in line:
+            # Find the first = that's not inside quotes; a quote-free key needs no char scan
+            eq_pos = line.find("=")
+            head = line[:eq_pos]
+            if '"' in head or "'" in head:
+                eq_pos = _find_unquoted_equals(line)
+
+            if eq_pos > 0:
+                key = line[:eq_pos].strip()
+                value = line[eq_pos + 1 :].strip()
+
+                # Handle trailing comma
+                if value.endswith(","):
+                    value = value[:-1]
+
+                # Check if value starts a nested structure or contains interpolation
+                if value.endswith("{") or ("${" in value and value.count("${") > value.count("}")):
+                    current_key = key
+                    current_value = [value]
+                    brace_count = value.count("{") - value.count("}")
+                else:
+                    # Simple value - handle interpolation properly
+                    value = value.strip("\"'")
+                    properties[key] = value
+
+    return properties
+
+
+def _parse_terraform_blocks(content: str) -> _ParsedBlocks:
+    """
+    Parse the variable, locals and AWS resource blocks of a single Terraform file.
+
+    This needs no analyzer state, so files can be parsed in worker processes; resource names
+    are resolved when the result is merged into the analyzer.
+    """
+    variables: Dict[str, str] = {}
+    locals_: Dict[str, str] = {}
+    resources: List[Tuple[str, str, Dict[str, str]]] = []
+
+    # Substring checks are far cheaper than the sweep; provider- or output-only files
+    # have no block worth parsing
+    if "variable" not in content and "locals" not in content and "aws_" not in content:
+        return variables, locals_, resources
+
+    # One sweep finds every block header; variable and locals bodies are matched in place,
+    # skipping headers nested inside the previous block of the same kind
+    variables_end = locals_end = 0
+    for match in _BLOCK_HEADER_RE.finditer(content):
+        kind = match.lastgroup
+        start = match.start()
+        if kind == "resource":
+            resource_type = match["resource_type"]
+            # Only AWS resources matter, so skip the brace scan for any other provider
+            if resource_type.startswith("aws_"):
+                resource_content = _block_body(content, match.end())
+                if resource_content is not None:
+                    resources.append(
+                        (
+                            resource_type,
+                            match["resource_name"],
+                            _parse_resource_properties(resource_content),
+                        )
+                    )
+        elif kind == "variable":
+            if start >= variables_end:
+                body = _block_body(content, match.end())
+                if body is not None:
+                    variables.update(_parse_variable_block(match["variable_name"], body))
+                    variables_end = match.end() + len(body) + 1
+        elif start >= locals_end:
+            block = _LOCALS_BLOCK_RE.match(content, start)
+            if block:
+                locals_.update(_parse_locals_block(block.group(1)))
+                locals_end = block.end()
+
+    return variables, locals_, resources
+
+
+def _parse_terraform_blocks_in_worker(content: str) -> Optional[_ParsedBlocks]:
+    """Parse a file in a worker process, returning None so the caller can retry in-process."""
+    try:
+        return _parse_terraform_blocks(content)
+    except Exception:
+        return None
+
 
 class TerraformAnalyzer:
     """Analyzes Terraform files and generates IAM permissions."""
 
+    # Starting worker processes costs more than parsing a handful of files in-process
+    PROCESS_POOL_MIN_FILES = 64
+
     def __init__(self):
         self.resources: List[TerraformResource] = []
         self.aws_services: Set[str] = set()
         self.variables: Dict[str, str] = {}
         self.locals: Dict[str, str] = {}
         self.terraform_locals: Dict[str, str] = {}
+        self.file_contents: Dict[str, str] = {}
+        # Resolved values keyed by raw value; cleared whenever a variable or local is recorded
+        self._resolve_cache: Dict[str, str] = {}
+        # Permissions per (service, resource type); many resources share the same pair
+        self._dynamic_permissions_cache: Dict[Tuple[str, str], tuple] = {}
+        self._common_service_permissions: Dict[str, tuple] = {}
+        # Resources by the bucket reference they point at; only set while generating permissions
+        self._s3_related_by_bucket: Optional[Dict[str, List[TerraformResource]]] = None
         self.service_permissions = AWS_PERMISSIONS
 
-    def scan_directory(self, directory: str) -> None:
-        """Scan directory for Terraform files (only in the specified directory, not subdirectories)."""
-        tf_files = []
+    def scan_directory(self, directory: str, file_names: Optional[Sequence[str]] = None) -> None:
+        """
+        Scan directory for Terraform files (only in the specified directory, not subdirectories).
 
-        # Only scan the specified directory, not subdirectories
-        try:
-            files = os.listdir(directory)
-            for file in files:
-                if file.endswith(".tf"):
-                    file_path = os.path.join(directory, file)
-                    if os.path.isfile(file_path):
-                        tf_files.append(file_path)
-        except OSError as e:
-            print(f"Error accessing directory {directory}: {e}")
-            return
+        Args:
+            directory: Directory containing the Terraform files
+            file_names: Names of the .tf files in the directory, if already listed by the caller
+        """
+        if file_names is not None:
+            tf_files = [os.path.join(directory, name) for name in file_names]
+        else:
+            # Only scan the specified directory, not subdirectories
+            try:
+                with os.scandir(directory) as entries:
+                    tf_files = [
+                        entry.path
+                        for entry in entries
+                        if entry.name.endswith(".tf") and entry.is_file()
+                    ]
+            except OSError as e:
+                print(f"Error accessing directory {directory}: {e}")
+                return
+
+        # Reads are I/O bound, so fetch files concurrently
+        max_workers = max(1, min(32, (os.cpu_count() or 1) * 4, len(tf_files)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            contents = list(executor.map(self._read_terraform_file, tf_files))
+
+        read_files = [
+            (path, content) for path, content in zip(tf_files, contents) if content is not None
+        ]
+        parsed = self._parse_in_processes([content for _, content in read_files])
 
-        for tf_file in tf_files:
-            self.parse_terraform_file(tf_file)
+        # Merging stays sequential because variables and locals from earlier files feed later ones
+        for (tf_file, content), blocks in zip(read_files, parsed):
+            self._parse_terraform_content(content, tf_file, blocks)
 
         # Resolve for_each resources after all files are parsed
         self.resources = self.resolve_for_each_resources(self.resources)
 
+    def _parse_in_processes(self, contents: List[str]) -> List[Optional[_ParsedBlocks]]:
+        """
+        Parse file contents in worker processes when there are enough files to pay for them.
+
+        Entries are None for files left to be parsed in-process, which is all of them for
+        small directories or where worker processes are unavailable.
+        """
+        if len(contents) < self.PROCESS_POOL_MIN_FILES:
+            return [None] * len(contents)
+        try:
+            with ProcessPoolExecutor() as executor:
+                return list(executor.map(_parse_terraform_blocks_in_worker, contents, chunksize=8))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            return [None] * len(contents)
+
+    def _read_terraform_file(self, file_path: str) -> Optional[str]:
+        """Read a Terraform file, returning None if it cannot be read."""
+        try:
+            # Invalid bytes are replaced rather than discarding the file, and newlines are
+            # normalized as text mode would
+            content = _read_file_bytes(file_path).decode("utf-8", errors="replace")
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            return content
+        except Exception as e:
+            print(f"Warning: Could not parse {file_path}: {e}")
+            return None
+
     def parse_terraform_file(self, file_path: str) -> None:
         """Parse a single Terraform file."""
+        content = self._read_terraform_file(file_path)
+        if content is not None:
+            self._parse_terraform_content(content, file_path)
+
+    def _parse_terraform_content(
+        self, content: str, file_path: str, parsed: Optional[_ParsedBlocks] = None
+    ) -> None:
+        """Parse the contents of a single Terraform file, unless a worker already did."""
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Extract variables and locals first
-            self.extract_variables_and_locals(content)
+            self.file_contents[file_path] = content
+            variables, locals_, resources = (
+                parsed if parsed is not None else _parse_terraform_blocks(content)
+            )
 
-            # Extract resources
-            self.extract_resources(content, file_path)
+            # Definitions come first so resource names can use values from later in the file
+            self._record_definitions(variables, locals_)
+            for resource_type, resource_name, properties in resources:
+                self._add_resource(resource_type, resource_name, properties, file_path)
 
         except Exception as e:
             print(f"Warning: Could not parse {file_path}: {e}")
 
+    def get_combined_content(self) -> str:
+        """Return the contents of all scanned Terraform files, separated by blank lines."""
+        return "".join(content + "\n\n" for content in self.file_contents.values())
+
     def extract_variables_and_locals(self, content: str) -> None:
         """Extract variables, locals, and data sources from Terraform content."""
-        # Extract variables
-        variable_pattern = r'variable\s+["\']([^"\']+)["\']\s*\{([^}]*(?:\{[^}]*\}[^}]*)*)\}'
-        for match in re.finditer(variable_pattern, content, re.MULTILINE | re.DOTALL):
-            var_name = match.group(1)
-            var_content = match.group(2)
-
-            # Extract default value if present
-            default_match = re.search(r"default\s*=\s*([^\n]+)", var_content)
-            if default_match:
-                default_value = default_match.group(1).strip().strip("\"'")
-                self.variables[f"var.{var_name}"] = default_value
-
-        # Extract locals - improved parsing with better brace matching
-        locals_pattern = r"locals\s*\{(.*?)\n\}"
-        for match in re.finditer(locals_pattern, content, re.MULTILINE | re.DOTALL):
-            locals_content = match.group(1)
-
-            # Parse each local definition more carefully
-            lines = locals_content.split("\n")
-            current_local = None
-            current_value = []
-            brace_count = 0
-
-            for line in lines:
-                stripped = line.strip()
-                if not stripped or stripped.startswith("#"):
-                    continue
-
-                # Count braces to handle nested structures
-                brace_count += stripped.count("{") - stripped.count("}")
-
-                # Check for new local definition (at brace level 0)
-                if brace_count == 0 and "=" in stripped:
-                    # Save previous local if exists
-                    if current_local and current_value:
-                        full_value = "\n".join(current_value).strip().strip("\"'")
-                        if full_value.endswith(","):
-                            full_value = full_value[:-1]
-                        self.locals[f"local.{current_local}"] = full_value
-
-                    # Parse new local
-                    eq_pos = stripped.find("=")
-                    if eq_pos > 0:
-                        current_local = stripped[:eq_pos].strip()
-                        value_part = stripped[eq_pos + 1 :].strip()
-                        current_value = [value_part]
-                        brace_count += value_part.count("{") - value_part.count("}")
-                else:
-                    # Continue current local value
-                    if current_local:
-                        current_value.append(stripped)
+        variables: Dict[str, str] = {}
+        variables_end = 0
+        for match in _VARIABLE_HEADER_RE.finditer(content):
+            if match.start() < variables_end:
+                continue
+            body = _block_body(content, match.end())
+            if body is not None:
+                variables.update(_parse_variable_block(match.group(1), body))
+                variables_end = match.end() + len(body) + 1
 
-            # Save last local
-            if current_local and current_value:
-                full_value = "\n".join(current_value).strip().strip("\"'")
-                if full_value.endswith(","):
-                    full_value = full_value[:-1]
-                self.locals[f"local.{current_local}"] = full_value
+        locals_: Dict[str, str] = {}
+        for match in _LOCALS_BLOCK_RE.finditer(content):
+            locals_.update(_parse_locals_block(match.group(1)))
+
+        self._record_definitions(variables, locals_)
+
+    def _record_definitions(self, variables: Dict[str, str], locals_: Dict[str, str]) -> None:
+        """Record variable defaults and locals, invalidating previously resolved values."""
+        if variables or locals_:
+            self.variables.update(variables)
+            self.locals.update(locals_)
+            self._resolve_cache.clear()
 
     def resolve_variable_reference(self, value: str) -> str:
         """Resolve variable and local references with better interpolation support."""
         if not isinstance(value, str):
             return str(value)
 
+        # Plain values have nothing to resolve, so skip the pattern passes below
+        if "${" not in value and "var." not in value and "local." not in value:
+            return value
+
+        cached = self._resolve_cache.get(value)
+        if cached is not None:
+            return cached
+
         result = value
 
         # Handle complex string interpolation with multiple variables/locals
         # Pattern: ${var.name} or ${local.name} or ${var.name}-${local.other}
-        interpolation_pattern = r"\$\{([^}]+)\}"
-
         def replace_interpolation(match):
             expression = match.group(1)
+            # Dispatch on the reference kind, e.g. "var" for ${var.name}
+            kind, dot, _ = expression.partition(".")
+            if not dot:
+                return match.group(0)
 
-            # Handle random_id patterns (e.g., ${random_id.suffix.hex})
-            if expression.startswith("random_id."):
+            # Handle random_id and for_each patterns (e.g., ${random_id.suffix.hex}, ${each.value})
+            if kind in _WILDCARD_REFERENCE_KINDS:
                 return "*"  # Replace with wildcard
 
-            # Handle for_each patterns (e.g., ${each.value})
-            if expression.startswith("each."):
-                return "*"  # Replace with wildcard
+            # Handle data source references - for now, just replace with a placeholder
+            if kind == "data":
+                return f"{expression[5:]}-*"
 
             # Handle variable references
-            if expression.startswith("var."):
-                var_name = expression
-                if var_name in self.variables:
-                    return self.variables[var_name]
+            if kind == "var":
+                if expression in self.variables:
+                    return self.variables[expression]
 
             # Handle local references
-            elif expression.startswith("local."):
-                local_name = expression
-                if local_name in self.locals:
-                    return self.resolve_variable_reference(self.locals[local_name])
-
-            # Handle resource references (like aws_vpc.main.id)
-            elif "." in expression:
-                parts = expression.split(".")
-                if len(parts) >= 2:
-                    resource_type = parts[0]
-                    resource_name = parts[1]
-                    # Try to find a matching resource and return a placeholder
-                    for res in self.resources:
-                        if res.type == f"aws_{resource_type}" and res.name == resource_name:
-                            return f"${{{expression}}}"  # Keep as placeholder for now
-
-            # Return original if we can't resolve
+            elif kind == "local":
+                if expression in self.locals:
+                    return self.resolve_variable_reference(self.locals[expression])
+
+            # Anything else, such as a resource reference (aws_vpc.main.id), is kept as a
+            # placeholder, as are unknown variables and locals
             return match.group(0)
 
         # Apply interpolation replacement
-        result = re.sub(interpolation_pattern, replace_interpolation, result)
-
-        # Handle simple variable references (without ${})
-        var_pattern = r"var\.([a-zA-Z_][a-zA-Z0-9_]*)"
-        for var_match in re.finditer(var_pattern, result):
-            var_name = f"var.{var_match.group(1)}"
-            if var_name in self.variables:
-                result = result.replace(var_match.group(0), self.variables[var_name])
-
-        # Handle simple local references (without ${})
-        local_pattern = r"local\.([a-zA-Z_][a-zA-Z0-9_]*)"
-        for local_match in re.finditer(local_pattern, result):
-            local_name = f"local.{local_match.group(1)}"
-            if local_name in self.locals:
-                resolved = self.resolve_variable_reference(self.locals[local_name])
-                result = result.replace(local_match.group(0), resolved)
-
-        # Handle data source references
-        data_pattern = r"\$\{data\.([^}]+)\}"
-        for data_match in re.finditer(data_pattern, result):
-            # For now, just replace with a placeholder
-            result = result.replace(data_match.group(0), f"{data_match.group(1)}-*")
+        result = _INTERPOLATION_RE.sub(replace_interpolation, result)
+
+        # Handle simple variable and local references (without ${})
+        def replace_reference(match):
+            reference = match.group(0)
+            if reference in self.variables:
+                return self.variables[reference]
+            if reference in self.locals:
+                return self.resolve_variable_reference(self.locals[reference])
+            return reference
+
+        if "var." in result or "local." in result:
+            result = _SIMPLE_REF_RE.sub(replace_reference, result)
 
+        self._resolve_cache[value] = result
         return result
 
     def expand_for_each_values(self, value: str) -> List[str]:
@@ -221,158 +726,50 @@ class TerraformAnalyzer:
 
     def extract_resources(self, content: str, file_path: str) -> None:
         """Extract AWS resources from Terraform content."""
-        # Find resource blocks manually to handle nested braces properly
-        resource_pattern = r'resource\s+["\']([^"\']+)["\']\s+["\']([^"\']+)["\']\s*\{'
+        # A substring check is far cheaper than the regex sweep over a file with no AWS resources
+        if "aws_" not in content:
+            return
 
-        for match in re.finditer(resource_pattern, content, re.MULTILINE):
+        # Find resource blocks manually to handle nested braces properly
+        for match in _RESOURCE_BLOCK_RE.finditer(content):
             resource_type = match.group(1)
-            resource_name = match.group(2)
-
-            # Find the matching closing brace
-            start_pos = match.end()
-            brace_count = 1
-            pos = start_pos
-
-            while pos < len(content) and brace_count > 0:
-                if content[pos] == "{":
-                    brace_count += 1
-                elif content[pos] == "}":
-                    brace_count -= 1
-                pos += 1
-
-            if brace_count == 0:
-                resource_content = content[start_pos : pos - 1]
-            else:
-                # Malformed resource block, skip
+            # Only AWS resources matter, so skip the brace scan for any other provider
+            if not resource_type.startswith("aws_"):
                 continue
-
-            if resource_type.startswith("aws_"):
-                # Extract resource properties
-                properties = self._extract_resource_properties(resource_content)
-
-                # Extract specific resource name
-                actual_name = self._extract_resource_name(resource_type, resource_name, properties)
-
-                resource = TerraformResource(
-                    type=resource_type,
-                    name=resource_name,
-                    resource_name=actual_name,
-                    file_path=file_path,
-                    properties=properties,
+            resource_content = _block_body(content, match.end())
+            if resource_content is not None:
+                self._add_resource(
+                    resource_type,
+                    match.group(2),
+                    _parse_resource_properties(resource_content),
+                    file_path,
                 )
 
-                self.resources.append(resource)
-
-                # Track AWS services
-                service = (
-                    resource_type.split("_")[1]
-                    if len(resource_type.split("_")) > 1
-                    else resource_type
-                )
-                self.aws_services.add(service)
-
-    def _extract_resource_properties(self, content: str) -> Dict[str, str]:
-        """Extract key-value pairs from resource content with better parsing."""
-        properties = {}
-
-        # More sophisticated parsing that handles complex Terraform syntax
-        lines = content.split("\n")
-        current_key = None
-        current_value = []
-        brace_count = 0
-
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            # Handle multi-line values and nested structures
-            if brace_count > 0:
-                current_value.append(line)
-                brace_count += line.count("{") - line.count("}")
-                if brace_count == 0:
-                    # End of nested structure
-                    if current_key:
-                        value_str = "\n".join(current_value).strip()
-                        properties[current_key] = value_str
-                        current_key = None
-                        current_value = []
-                continue
+    def _add_resource(
+        self, resource_type: str, resource_name: str, properties: Dict[str, str], file_path: str
+    ) -> None:
+        """Record a parsed resource, resolving its name against the known variables and locals."""
+        # Extract specific resource name
+        actual_name = self._extract_resource_name(resource_type, resource_name, properties)
+
+        resource = TerraformResource(
+            type=resource_type,
+            name=resource_name,
+            resource_name=actual_name,
+            file_path=file_path,
+            properties=properties,
+        )
 
-            # Handle key-value pairs
-            if "=" in line:
-                # Find the first = that's not inside quotes
-                eq_pos = -1
-                in_quotes = False
-                quote_char = None
-
-                for i, char in enumerate(line):
-                    if char in ['"', "'"] and (i == 0 or line[i - 1] != "\\"):
-                        if not in_quotes:
-                            in_quotes = True
-                            quote_char = char
-                        elif char == quote_char:
-                            in_quotes = False
-                            quote_char = None
-                    elif char == "=" and not in_quotes:
-                        eq_pos = i
-                        break
-
-                if eq_pos > 0:
-                    key = line[:eq_pos].strip()
-                    value = line[eq_pos + 1 :].strip()
-
-                    # Handle trailing comma
-                    if value.endswith(","):
-                        value = value[:-1]
-
-                    # Check if value starts a nested structure or contains interpolation
-                    if value.endswith("{") or (
-                        "${" in value and value.count("${") > value.count("}")
-                    ):
-                        current_key = key
-                        current_value = [value]
-                        brace_count = value.count("{") - value.count("}")
-                    else:
-                        # Simple value - handle interpolation properly
-                        value = value.strip("\"'")
-                        properties[key] = value
+        self.resources.append(resource)
 
-        return properties
+        # Track AWS services
+        self.aws_services.add(resource.service)
 
     def _extract_resource_name(
         self, resource_type: str, terraform_name: str, properties: Dict[str, str]
     ) -> Optional[str]:
         """Extract the actual resource name from properties or use Terraform name."""
-        # Common name properties for different resource types
-        name_properties = {
-            "aws_s3_bucket": "bucket",
-            "aws_iam_role": "name",
-            "aws_iam_policy": "name",
-            "aws_iam_user": "name",
-            "aws_lambda_function": "function_name",
-            "aws_rds_instance": "identifier",
-            "aws_rds_subnet_group": "name",
-            "aws_cloudwatch_log_group": "name",
-            "aws_cloudwatch_metric_alarm": "alarm_name",
-            "aws_vpc": "name",  # VPC doesn't have a name property, but let's check
-            "aws_subnet": "name",  # Subnet doesn't have a name property, but let's check
-            "aws_security_group": "name",  # Security group doesn't have a name property, but let's check
-            "aws_internet_gateway": "name",  # IGW doesn't have a name property, but let's check
-            "aws_route53_zone": "name",
-            "aws_route53_record": "name",
-            "aws_cloudfront_distribution": "name",  # CloudFront doesn't have a name property
-            "aws_wafv2_web_acl": "name",
-            "aws_eks_cluster": "name",
-            "aws_dynamodb_table": "name",
-            "aws_elasticache_replication_group": "name",  # Actually "replication_group_id"
-            "aws_api_gateway_rest_api": "name",
-            "aws_api_gateway_resource": "name",  # Actually "path_part"
-            "aws_api_gateway_method": "name",  # Actually "http_method"
-            "aws_sfn_state_machine": "name",
-        }
-
-        name_prop = name_properties.get(resource_type, "name")
+        name_prop = _RESOURCE_NAME_PROPERTIES.get(resource_type, "name")
 
         if name_prop in properties:
             raw_value = properties[name_prop]
@@ -384,7 +781,7 @@ class TerraformAnalyzer:
 
         # For resources without explicit names, try to construct a meaningful name
         # using variables and locals if available
-        if resource_type in ["aws_vpc", "aws_subnet", "aws_security_group", "aws_internet_gateway"]:
+        if resource_type in _UNNAMED_RESOURCE_TYPES:
             # These resources don't have name properties, so we'll use tags or construct from context
             return None  # Let ARN builder handle with wildcards
 
@@ -402,20 +799,7 @@ class TerraformAnalyzer:
 
         # For S3 bucket-related resources (versioning, encryption, etc.),
         # don't create separate statements but let them contribute to main bucket permissions
-        if resource.type in [
-            "aws_s3_bucket_versioning",
-            "aws_s3_bucket_server_side_encryption_configuration",
-            "aws_s3_bucket_policy",
-            "aws_s3_bucket_cors_configuration",
-            "aws_s3_bucket_website_configuration",
-            "aws_s3_bucket_acl",
-            "aws_s3_bucket_lifecycle_configuration",
-            "aws_s3_bucket_logging",
-            "aws_s3_bucket_notification",
-            "aws_s3_bucket_public_access_block",
-            "aws_s3_bucket_object_lock_configuration",
-            "aws_s3_bucket_replication_configuration",
-        ]:
+        if resource.type in _S3_CONFIGURATION_TYPES:
             # These resources don't need separate statements
             # They're configuration resources that work with the main bucket
             return s3_groups
@@ -432,36 +816,42 @@ class TerraformAnalyzer:
         self, bucket_resource: TerraformResource
     ) -> List[TerraformResource]:
         """Get S3 resources that are related to the main bucket (versioning, encryption, etc.)."""
-        related_resources = []
+        related_by_bucket = self._s3_related_by_bucket
+        if related_by_bucket is None:
+            related_by_bucket = self._index_s3_related_resources()
 
         # Look for resources that reference this bucket
-        bucket_name = bucket_resource.name
-        bucket_reference = f"aws_s3_bucket.{bucket_name}"
+        bucket_reference = f"aws_s3_bucket.{bucket_resource.name}"
+        return [
+            resource
+            for resource in related_by_bucket.get(bucket_reference, ())
+            if resource is not bucket_resource
+        ]
 
+    def _index_s3_related_resources(self) -> Dict[str, List[TerraformResource]]:
+        """Group resources by the aws_s3_bucket reference in their bucket property."""
+        related_by_bucket: Dict[str, List[TerraformResource]] = {}
         for resource in self.resources:
-            if resource == bucket_resource:
+            if not resource.properties:
                 continue
-
-            # Check if this resource references the bucket
-            if hasattr(resource, "properties") and resource.properties:
-                bucket_ref = resource.properties.get("bucket", "")
-                if bucket_ref == f"{bucket_reference}.id" or bucket_ref == bucket_reference:
-                    related_resources.append(resource)
-
-        return related_resources
+            bucket_ref = resource.properties.get("bucket")
+            if not isinstance(bucket_ref, str) or not bucket_ref.startswith("aws_s3_bucket."):
+                continue
+            # Both aws_s3_bucket.<name> and aws_s3_bucket.<name>.id point at the bucket
+            if bucket_ref.endswith(".id"):
+                bucket_ref = bucket_ref[:-3]
+            related_by_bucket.setdefault(bucket_ref, []).append(resource)
+        return related_by_bucket
 
     def _get_s3_bucket_permissions(self, resource: TerraformResource) -> List[str]:
         """Get S3 bucket permissions based on features used."""
-        bucket_permissions = []
-
-        # Base bucket permissions
-        base_permissions = [
+        # Base bucket permissions; a set from the start drops duplicates as they are added
+        bucket_permissions: Set[str] = {
             "s3:CreateBucket",
             "s3:DeleteBucket",
             "s3:ListBucket",
             "s3:GetBucketLocation",
-        ]
-        bucket_permissions.extend(base_permissions)
+        }
 
         # Analyze resource properties to determine additional permissions needed
         properties = resource.properties or {}
@@ -472,121 +862,122 @@ class TerraformAnalyzer:
             if related_resource.properties:
                 properties.update(related_resource.properties)
 
+        # Stringify and scan the properties once for every feature below
+        features = _s3_features(properties)
+
         # Versioning permissions
-        if self._has_versioning_features(properties):
-            bucket_permissions.extend(
-                ["s3:GetBucketVersioning", "s3:PutBucketVersioning", "s3:ListBucketVersions"]
+        if self._has_versioning_features(properties, features):
+            bucket_permissions.update(
+                ("s3:GetBucketVersioning", "s3:PutBucketVersioning", "s3:ListBucketVersions")
             )
 
         # Policy permissions
-        if self._has_policy_features(properties):
-            bucket_permissions.extend(
-                ["s3:GetBucketPolicy", "s3:PutBucketPolicy", "s3:DeleteBucketPolicy"]
+        if "policy" in features:
+            bucket_permissions.update(
+                ("s3:GetBucketPolicy", "s3:PutBucketPolicy", "s3:DeleteBucketPolicy")
             )
 
         # CORS permissions
-        if self._has_cors_features(properties):
-            bucket_permissions.extend(
-                ["s3:GetBucketCors", "s3:PutBucketCors", "s3:DeleteBucketCors"]
+        if self._has_cors_features(properties, features):
+            bucket_permissions.update(
+                ("s3:GetBucketCors", "s3:PutBucketCors", "s3:DeleteBucketCors")
             )
 
         # Website permissions
-        if self._has_website_features(properties):
-            bucket_permissions.extend(
-                ["s3:GetBucketWebsite", "s3:PutBucketWebsite", "s3:DeleteBucketWebsite"]
+        if "website" in features:
+            bucket_permissions.update(
+                ("s3:GetBucketWebsite", "s3:PutBucketWebsite", "s3:DeleteBucketWebsite")
             )
 
         # ACL permissions
-        if self._has_acl_features(properties):
-            bucket_permissions.extend(["s3:GetBucketAcl", "s3:PutBucketAcl"])
+        if "acl" in features:
+            bucket_permissions.update(("s3:GetBucketAcl", "s3:PutBucketAcl"))
 
         # Encryption permissions
-        if self._has_encryption_features(properties):
-            bucket_permissions.extend(
-                ["s3:GetBucketEncryption", "s3:PutBucketEncryption", "s3:DeleteBucketEncryption"]
+        if "encryption" in features:
+            bucket_permissions.update(
+                ("s3:GetBucketEncryption", "s3:PutBucketEncryption", "s3:DeleteBucketEncryption")
             )
 
         # Lifecycle permissions
-        if self._has_lifecycle_features(properties):
-            bucket_permissions.extend(
-                [
+        if self._has_lifecycle_features(properties, features):
+            bucket_permissions.update(
+                (
                     "s3:GetBucketLifecycleConfiguration",
                     "s3:PutBucketLifecycleConfiguration",
                     "s3:DeleteBucketLifecycleConfiguration",
-                ]
+                )
             )
 
         # Logging permissions
-        if self._has_logging_features(properties):
-            bucket_permissions.extend(["s3:GetBucketLogging", "s3:PutBucketLogging"])
+        if "logging" in features:
+            bucket_permissions.update(("s3:GetBucketLogging", "s3:PutBucketLogging"))
 
         # Tagging permissions
         if self._has_tagging_features(properties):
-            bucket_permissions.extend(["s3:GetBucketTagging", "s3:PutBucketTagging"])
+            bucket_permissions.update(("s3:GetBucketTagging", "s3:PutBucketTagging"))
 
         # Public access block permissions
-        if self._has_public_access_features(properties):
-            bucket_permissions.extend(
-                ["s3:GetBucketPublicAccessBlock", "s3:PutBucketPublicAccessBlock"]
+        if "public_access" in features:
+            bucket_permissions.update(
+                ("s3:GetBucketPublicAccessBlock", "s3:PutBucketPublicAccessBlock")
             )
 
         # Object lock permissions
-        if self._has_object_lock_features(properties):
-            bucket_permissions.extend(["s3:GetBucketObjectLockConfiguration"])
+        if "object_lock" in features:
+            bucket_permissions.add("s3:GetBucketObjectLockConfiguration")
 
         # Replication permissions
-        if self._has_replication_features(properties):
-            bucket_permissions.extend(
-                ["s3:GetReplicationConfiguration", "s3:PutReplicationConfiguration"]
+        if "replication" in features:
+            bucket_permissions.update(
+                ("s3:GetReplicationConfiguration", "s3:PutReplicationConfiguration")
             )
 
         # Multipart upload permissions
-        bucket_permissions.extend(
-            [
+        bucket_permissions.update(
+            (
                 "s3:ListBucketMultipartUploads",
                 "s3:ListMultipartUploadParts",
                 "s3:AbortMultipartUpload",
-            ]
+            )
         )
 
-        return list(set(bucket_permissions))  # Remove duplicates
+        return list(bucket_permissions)
 
     def _get_s3_object_permissions(self, resource: TerraformResource) -> List[str]:
         """Get S3 object permissions based on features used."""
-        object_permissions = []
-
         # Base object permissions
-        base_permissions = ["s3:GetObject", "s3:PutObject", "s3:DeleteObject"]
-        object_permissions.extend(base_permissions)
+        object_permissions: Set[str] = {"s3:GetObject", "s3:PutObject", "s3:DeleteObject"}
 
         # Analyze resource properties
         properties = resource.properties or {}
+        features = _s3_features(properties)
 
         # Versioning-related object permissions
-        if self._has_versioning_features(properties):
-            object_permissions.extend(
-                ["s3:GetObjectVersion", "s3:DeleteObjectVersion", "s3:ListObjectVersions"]
+        if self._has_versioning_features(properties, features):
+            object_permissions.update(
+                ("s3:GetObjectVersion", "s3:DeleteObjectVersion", "s3:ListObjectVersions")
             )
 
         # ACL permissions for objects
-        if self._has_acl_features(properties):
-            object_permissions.extend(
-                [
+        if "acl" in features:
+            object_permissions.update(
+                (
                     "s3:GetObjectAcl",
                     "s3:PutObjectAcl",
                     "s3:GetObjectVersionAcl",
                     "s3:PutObjectVersionAcl",
-                ]
+                )
             )
 
         # Object tagging
         if self._has_tagging_features(properties):
-            object_permissions.extend(["s3:GetObjectTagging", "s3:PutObjectTagging"])
+            object_permissions.update(("s3:GetObjectTagging", "s3:PutObjectTagging"))
 
         # Object attributes and metadata
-        object_permissions.extend(["s3:GetObjectAttributes", "s3:HeadObject"])
+        object_permissions.update(("s3:GetObjectAttributes", "s3:HeadObject"))
 
-        return list(set(object_permissions))  # Remove duplicates
+        return list(object_permissions)
 
     def _get_s3_resource_arn(
         self, resource: TerraformResource, s3_type: str
@@ -632,111 +1023,53 @@ class TerraformAnalyzer:
         else:
             return "arn:aws:s3:::*"
 
-    def _has_versioning_features(self, properties: Dict) -> bool:
+    def _has_versioning_features(self, properties: Dict, features: Set[str]) -> bool:
         """Check if resource has versioning-related features."""
-        versioning_indicators = [
-            "versioning",
-            "versioning_configuration",
-            "versioning_enabled",
-            "versioning_mfa_delete",
-            "versioning_status",
-        ]
         # Check for versioning resource type or versioning-related properties
-        if "versioning" in str(properties).lower():
+        if "versioning" in features:
             return True
         # Check for status field which indicates versioning configuration
-        if "status" in properties and properties["status"] in ["Enabled", "Suspended"]:
-            return True
-        return False
+        return properties.get("status") in ("Enabled", "Suspended")
 
-    def _has_policy_features(self, properties: Dict) -> bool:
-        """Check if resource has policy-related features."""
-        policy_indicators = ["policy", "bucket_policy"]
-        return any(key in str(properties).lower() for key in policy_indicators)
-
-    def _has_cors_features(self, properties: Dict) -> bool:
+    def _has_cors_features(self, properties: Dict, features: Set[str]) -> bool:
         """Check if resource has CORS-related features."""
-        cors_indicators = ["cors_rule", "cors_configuration"]
-        if any(key in str(properties).lower() for key in cors_indicators):
-            return True
-        # Check for CORS-related properties
-        cors_properties = [
-            "allowed_headers",
-            "allowed_methods",
-            "allowed_origins",
-            "max_age_seconds",
-        ]
-        return any(key in properties for key in cors_properties)
+        return "cors" in features or any(key in properties for key in _CORS_PROPERTIES)
 
-    def _has_website_features(self, properties: Dict) -> bool:
-        """Check if resource has website-related features."""
-        website_indicators = ["website", "website_configuration", "website_endpoint"]
-        return any(key in str(properties).lower() for key in website_indicators)
-
-    def _has_acl_features(self, properties: Dict) -> bool:
-        """Check if resource has ACL-related features."""
-        acl_indicators = ["acl", "access_control_list"]
-        return any(key in str(properties).lower() for key in acl_indicators)
-
-    def _has_encryption_features(self, properties: Dict) -> bool:
-        """Check if resource has encryption-related features."""
-        encryption_indicators = ["encryption", "server_side_encryption", "sse"]
-        return any(key in str(properties).lower() for key in encryption_indicators)
-
-    def _has_lifecycle_features(self, properties: Dict) -> bool:
+    def _has_lifecycle_features(self, properties: Dict, features: Set[str]) -> bool:
         """Check if resource has lifecycle-related features."""
-        lifecycle_indicators = ["lifecycle", "lifecycle_rule", "lifecycle_configuration"]
-        if any(key in str(properties).lower() for key in lifecycle_indicators):
-            return True
-        # Check for lifecycle-related properties
-        lifecycle_properties = [
-            "noncurrent_days",
-            "noncurrent_version_expiration",
-            "transition",
-            "expiration",
-        ]
-        return any(key in properties for key in lifecycle_properties)
-
-    def _has_logging_features(self, properties: Dict) -> bool:
-        """Check if resource has logging-related features."""
-        logging_indicators = ["logging", "access_logging", "log_bucket"]
-        return any(key in str(properties).lower() for key in logging_indicators)
+        return "lifecycle" in features or any(key in properties for key in _LIFECYCLE_PROPERTIES)
 
     def _has_tagging_features(self, properties: Dict) -> bool:
         """Check if resource has tagging-related features."""
         return "tags" in properties
 
-    def _has_public_access_features(self, properties: Dict) -> bool:
-        """Check if resource has public access block features."""
-        public_access_indicators = ["public_access_block", "block_public_acls"]
-        return any(key in str(properties).lower() for key in public_access_indicators)
-
-    def _has_object_lock_features(self, properties: Dict) -> bool:
-        """Check if resource has object lock features."""
-        object_lock_indicators = ["object_lock", "object_lock_configuration"]
-        return any(key in str(properties).lower() for key in object_lock_indicators)
-
-    def _has_replication_features(self, properties: Dict) -> bool:
-        """Check if resource has replication features."""
-        replication_indicators = ["replication", "replication_configuration"]
-        return any(key in str(properties).lower() for key in replication_indicators)
-
     def generate_permissions(self) -> List[IAMStatement]:
         """Generate IAM permissions based on discovered AWS services and resources."""
+        # Every S3 bucket looks up its related resources, so index them once for this run
+        self._s3_related_by_bucket = self._index_s3_related_resources()
+        try:
+            return self._generate_permissions()
+        finally:
+            self._s3_related_by_bucket = None
+
+    def _generate_permissions(self) -> List[IAMStatement]:
+        """Build the statements for generate_permissions."""
         statements = []
 
         # Map discovered services to actual AWS service permissions
-        service_mapping = self._get_service_mapping()
+        service_mapping = _SERVICE_MAPPING
 
         # Group resources by service and permissions
-        permission_groups: Dict[str, Dict] = {}
+        permission_groups: Dict[str, Dict] = defaultdict(dict)
+        # Non-S3 actions depend only on the service and resource type, so each pair is mapped
+        # to its group once instead of hashing the sorted action tuple for every resource
+        groups_by_type: Dict[Tuple[str, str], Dict] = {}
 
         for resource in self.resources:
-            parts = resource.type.split("_")
-            if len(parts) >= 2:
-                service = parts[1]
+            if "_" in resource.type:
+                service = resource.service
                 aws_service = service_mapping.get(service, service)
-                resource_type = parts[-1] if len(parts) > 2 else parts[1]
+                resource_type = resource.resource_kind
 
                 # Special handling for S3 resources - create granular permissions
                 if aws_service == "s3":
@@ -745,11 +1078,10 @@ class TerraformAnalyzer:
                         service_key = f"s3_{s3_group['type']}"
                         actions_key = tuple(sorted(s3_group["actions"]))
 
-                        if service_key not in permission_groups:
-                            permission_groups[service_key] = {}
-
-                        if actions_key not in permission_groups[service_key]:
-                            permission_groups[service_key][actions_key] = {
+                        action_groups = permission_groups[service_key]
+                        group = action_groups.get(actions_key)
+                        if group is None:
+                            group = action_groups[actions_key] = {
                                 "resources": [],
                                 "resource_types": set(),
                                 "service": "s3",
@@ -757,31 +1089,34 @@ class TerraformAnalyzer:
                                 "s3_type": s3_group["type"],
                             }
 
-                        permission_groups[service_key][actions_key]["resources"].append(resource)
-                        permission_groups[service_key][actions_key]["resource_types"].add(
-                            s3_group["type"]
-                        )
+                        group["resources"].append(resource)
+                        group["resource_types"].add(s3_group["type"])
                 else:
                     # Standard handling for non-S3 resources
-                    actions = self._get_dynamic_permissions(aws_service, resource_type)
+                    type_key = (aws_service, resource_type)
+                    group = groups_by_type.get(type_key)
+
+                    if group is None:
+                        actions = self._get_dynamic_permissions(aws_service, resource_type)
 
-                    # Create a key based on service and permissions (not resource type)
-                    service_key = aws_service
-                    actions_key = tuple(sorted(actions))  # Use sorted tuple as key for consistency
+                        # Create a key based on service and permissions (not resource type)
+                        service_key = aws_service
+                        actions_key = tuple(sorted(actions))  # Sorted tuple for consistency
 
-                    if service_key not in permission_groups:
-                        permission_groups[service_key] = {}
+                        action_groups = permission_groups[service_key]
+                        group = action_groups.get(actions_key)
+                        if group is None:
+                            group = action_groups[actions_key] = {
+                                "resources": [],
+                                "resource_types": set(),
+                                "service": aws_service,
+                                "actions": actions,
+                            }
 
-                    if actions_key not in permission_groups[service_key]:
-                        permission_groups[service_key][actions_key] = {
-                            "resources": [],
-                            "resource_types": set(),
-                            "service": aws_service,
-                            "actions": actions,
-                        }
+                        group["resource_types"].add(resource_type)
+                        groups_by_type[type_key] = group
 
-                    permission_groups[service_key][actions_key]["resources"].append(resource)
-                    permission_groups[service_key][actions_key]["resource_types"].add(resource_type)
+                    group["resources"].append(resource)
 
         # Generate statements for each permission group
         for service_key, action_groups in permission_groups.items():
@@ -795,15 +1130,16 @@ class TerraformAnalyzer:
                 if aws_service == "s3" and "s3_type" in group_info:
                     # Special S3 granular SID
                     s3_type = group_info["s3_type"]
-                    sid = f"S3{s3_type.title()}"
+                    sid = f"S3{_titled(s3_type)}"
                 elif len(resource_types) == 1:
-                    sid = f"{aws_service.title()}{resource_types[0].title()}"
+                    sid = f"{_titled(aws_service)}{_titled(resource_types[0])}"
                 else:
                     # Group multiple resource types under the service
-                    sid = f"{aws_service.title()}Resources"
+                    sid = f"{_titled(aws_service)}Resources"
 
-                # Generate resource ARNs - either specific or wildcard
-                specific_arns = []
+                # Generate resource ARNs - either specific or wildcard; a dict keeps first-seen
+                # order while making the duplicate check constant time
+                specific_arns: Dict[str, None] = {}
                 for resource in resources:
                     # Special handling for S3 granular permissions
                     if aws_service == "s3" and "s3_type" in group_info:
@@ -814,16 +1150,14 @@ class TerraformAnalyzer:
 
                     # Handle both single ARN and list of ARNs
                     if isinstance(resource_arn, list):
-                        for arn in resource_arn:
-                            if arn and arn not in specific_arns:
-                                specific_arns.append(arn)
-                    elif resource_arn and resource_arn not in specific_arns:
-                        specific_arns.append(resource_arn)
+                        specific_arns.update(dict.fromkeys(arn for arn in resource_arn if arn))
+                    elif resource_arn:
+                        specific_arns[resource_arn] = None
 
                 # Use specific ARNs if available, otherwise use wildcard
                 if specific_arns:
                     # Use list of specific ARNs for multiple resources
-                    final_resource = specific_arns
+                    final_resource = list(specific_arns)
                 else:
                     # Use the most specific wildcard possible
                     if aws_service == "s3" and "s3_type" in group_info:
@@ -831,13 +1165,13 @@ class TerraformAnalyzer:
                         # Try to extract bucket prefix from resource names
                         bucket_prefix = None
                         for resource in resources:
-                            if hasattr(resource, "resource_name") and resource.resource_name:
+                            if resource.resource_name:
                                 # Extract prefix from resolved resource name (e.g., "tf-platform-playground-*")
                                 if "*" in resource.resource_name:
                                     bucket_prefix = resource.resource_name
                                     break
                                 # Or extract from bucket property if available
-                                elif hasattr(resource, "properties") and resource.properties:
+                                elif resource.properties:
                                     bucket_value = resource.properties.get("bucket", "")
                                     if bucket_value and not bucket_value.startswith("${"):
                                         bucket_prefix = bucket_value
@@ -857,110 +1191,39 @@ class TerraformAnalyzer:
                             f"arn:aws:{aws_service}:${{aws_region}}:${{aws_account}}:*"
                         ]
 
+                # Single-type groups are the common case and need no sorting
+                if len(resource_types) == 1:
+                    type_names = resource_types[0]
+                else:
+                    type_names = ", ".join(sorted(resource_types))
+
                 # Create statement with combined resources
                 statement = IAMStatement(
                     sid=sid,
                     effect="Allow",
                     action=list(actions),
                     resource=final_resource,
-                    explanation=f"Permissions for {aws_service} {', '.join(sorted(resource_types))} management",
+                    explanation=f"Permissions for {aws_service} {type_names} management",
                 )
                 statements.append(statement)
 
         return statements
 
-    def _get_service_mapping(self) -> Dict[str, str]:
+    def _get_service_mapping(self) -> Mapping[str, str]:
         """Get comprehensive service mapping."""
-        return {
-            # EC2 and related
-            "vpc": "ec2",
-            "subnet": "ec2",
-            "instance": "ec2",
-            "security": "ec2",
-            "internet": "ec2",
-            "network": "ec2",
-            "volume": "ec2",
-            "launch": "ec2",
-            "transit": "ec2",
-            "nat": "ec2",
-            "route": "ec2",
-            "client": "ec2",
-            "elastic": "ec2",
-            "dhcp": "ec2",
-            "egress": "ec2",
-            "image": "ec2",
-            "prefix": "ec2",
-            "account": "ec2",
-            # Other services
-            "db": "rds",
-            "rds": "rds",
-            "cloudwatch": "cloudwatch",
-            "logs": "logs",
-            "log": "logs",
-            "lambda": "lambda",
-            "route53": "route53",
-            "iam": "iam",
-            "s3": "s3",
-            "waf": "wafv2",
-            "wafv2": "wafv2",
-            "cloudfront": "cloudfront",
-            "eks": "eks",
-            "dynamodb": "dynamodb",
-            "dynamo": "dynamodb",
-            "elasticache": "elasticache",
-            "redis": "elasticache",
-            "api": "apigateway",
-            "apigateway": "apigateway",
-            "states": "states",
-            "sfn": "states",
-            "step": "states",
-            "ecr": "ecr",
-            "ecs": "ecs",
-            "lb": "elasticloadbalancing",
-            "load": "elasticloadbalancing",
-            "target": "elasticloadbalancing",
-            "listener": "elasticloadbalancing",
-            "events": "events",
-            "event": "events",
-            "firehose": "firehose",
-            "fis": "fis",
-            "guardduty": "guardduty",
-            "kms": "kms",
-            "organizations": "organizations",
-            "org": "organizations",
-            "secrets": "secretsmanager",
-            "secret": "secretsmanager",
-            "securityhub": "securityhub",
-            "security_hub": "securityhub",
-            "servicediscovery": "servicediscovery",
-            "service_discovery": "servicediscovery",
-            "signer": "signer",
-            "sns": "sns",
-            "sqs": "sqs",
-            "ssm": "ssm",
-            "parameter": "ssm",
-            "sts": "sts",
-            "transfer": "transfer",
-            "acm": "acm",
-            "certificate": "acm",
-            "airflow": "airflow",
-            "mwaa": "airflow",
-            "application_autoscaling": "application-autoscaling",
-            "app_autoscaling": "application-autoscaling",
-            "autoscaling": "autoscaling",
-            "asg": "autoscaling",
-            "backup": "backup",
-            "chatbot": "chatbot",
-            "cloudformation": "cloudformation",
-            "cfn": "cloudformation",
-            "cloudtrail": "cloudtrail",
-            "trail": "cloudtrail",
-            "cognito": "cognito-idp",
-            "user_pool": "cognito-idp",
-        }
+        return _SERVICE_MAPPING
 
     def _get_dynamic_permissions(self, aws_service: str, resource_type: str) -> tuple:
         """Get permissions dynamically, with fallback for unknown services."""
+        key = (aws_service, resource_type)
+        permissions = self._dynamic_permissions_cache.get(key)
+        if permissions is None:
+            permissions = self._compute_dynamic_permissions(aws_service, resource_type)
+            self._dynamic_permissions_cache[key] = permissions
+        return permissions
+
+    def _compute_dynamic_permissions(self, aws_service: str, resource_type: str) -> tuple:
+        """Look up or derive the permissions for a service and resource type."""
         # First, try to get from predefined mappings
         if (
             aws_service in self.service_permissions
@@ -970,6 +1233,17 @@ class TerraformAnalyzer:
 
         # If service exists but resource type doesn't, use service-wide permissions
         if aws_service in self.service_permissions:
+            common_permissions = self._get_common_service_permissions(aws_service)
+            if common_permissions:
+                return common_permissions
+
+        # Generate generic permissions for unknown services
+        return self._generate_generic_permissions(aws_service, resource_type)
+
+    def _get_common_service_permissions(self, aws_service: str) -> tuple:
+        """Return the permissions shared by several resource types of a service, computed once."""
+        common_permissions = self._common_service_permissions.get(aws_service)
+        if common_permissions is None:
             # Get all permissions for this service and return the most common ones
             all_permissions = []
             for rt_permissions in self.service_permissions[aws_service].values():
@@ -977,43 +1251,15 @@ class TerraformAnalyzer:
 
             # Return common permissions (appearing in multiple resource types)
             perm_counts = Counter(all_permissions)
-            common_permissions = [perm for perm, count in perm_counts.items() if count > 1]
-
-            if common_permissions:
-                return tuple(sorted(common_permissions))
-
-        # Generate generic permissions for unknown services
-        return self._generate_generic_permissions(aws_service, resource_type)
+            common_permissions = tuple(
+                sorted(perm for perm, count in perm_counts.items() if count > 1)
+            )
+            self._common_service_permissions[aws_service] = common_permissions
+        return common_permissions
 
     def _generate_generic_permissions(self, aws_service: str, resource_type: str) -> tuple:
         """Generate generic permissions for unknown AWS services."""
-        service_prefix = aws_service.lower()
-
-        # Common permission patterns across AWS services
-        generic_permissions = [
-            f"{service_prefix}:Create{resource_type.title()}",
-            f"{service_prefix}:Delete{resource_type.title()}",
-            f"{service_prefix}:Describe{resource_type.title()}",
-            f"{service_prefix}:List{resource_type.title()}",
-            f"{service_prefix}:Get{resource_type.title()}",
-            f"{service_prefix}:Update{resource_type.title()}",
-            f"{service_prefix}:Modify{resource_type.title()}",
-            f"{service_prefix}:Put{resource_type.title()}",
-            f"{service_prefix}:Tag{resource_type.title()}",
-            f"{service_prefix}:Untag{resource_type.title()}",
-            f"{service_prefix}:ListTagsFor{resource_type.title()}",
-        ]
-
-        # Add service-wide permissions
-        service_permissions = [
-            f"{service_prefix}:Describe*",
-            f"{service_prefix}:List*",
-            f"{service_prefix}:Get*",
-        ]
-
-        # Combine and return
-        all_permissions = generic_permissions + service_permissions
-        return tuple(sorted(all_permissions))
+        return _generic_permissions(aws_service, resource_type)
 
     def _get_resource_arn_for_resource(
         self, service: str, resource: TerraformResource
@@ -1022,11 +1268,10 @@ class TerraformAnalyzer:
         # Check if we have a specific resource name
         if resource.resource_name and resource.resource_name != resource.name:
             specific_arn = ARNBuilder.build_specific_arn(
-                service, resource.type.split("_")[-1], resource.resource_name
+                service, resource.resource_kind, resource.resource_name
             )
             if specific_arn:
                 return specific_arn
 
         # Fallback to wildcard
-        resource_type = resource.type.split("_")[-1]
-        return ARNBuilder.get_resource_arn(service, resource_type)
+        return ARNBuilder.get_resource_arn(service, resource.resource_kind)
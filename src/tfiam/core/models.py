@@ -1,6 +1,7 @@
 """Data models for TFIAM."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
@@ -24,7 +25,16 @@ class TerraformResource:
     resource_name: Optional[str] = None
     file_path: str = ""
     properties: Optional[Dict[str, Any]] = None
+    # Derived from type once, e.g. "s3" and "bucket" for aws_s3_bucket
+    service: str = field(init=False, repr=False)
+    resource_kind: str = field(init=False, repr=False)
 
     def __post_init__(self):
         if self.properties is None:
             self.properties = {}
+        # Interned so the many dict and set lookups keyed on these compare by identity
+        self.type = sys.intern(self.type)
+        # Only the second and last segments are needed, so avoid splitting the whole type
+        parts = self.type.split("_", 2)
+        self.service = sys.intern(parts[1]) if len(parts) > 1 else self.type
+        self.resource_kind = sys.intern(self.type.rpartition("_")[2])
@@ -1,23 +1,97 @@
 """OpenAI integration for generating explanations and verification."""
 
+import atexit
+import importlib.util
+import json
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 import openai
 
 from ..utils.cache import AIResponseCache
+from ..utils.rate_limiter import RateLimiter, retry_with_backoff
 from .models import IAMStatement, TerraformResource
 
 
+@lru_cache(maxsize=None)
+def _shared_http_client() -> openai.DefaultHttpxClient:
+    """Return the process-wide HTTP client so all requests reuse pooled connections."""
+    # HTTP/2 multiplexes concurrent requests over one connection when h2 is installed
+    client = openai.DefaultHttpxClient(http2=importlib.util.find_spec("h2") is not None)
+    atexit.register(client.close)
+    return client
+
+
 class OpenAIAnalyzer:
     """OpenAI-powered analysis for IAM statements with verification and optimization."""
 
-    def __init__(self, api_key: str, cache_dir: str = ".tfiam-cache"):
-        self.client = openai.OpenAI(api_key=api_key)
+    # Model used for policy verification and optimization
+    ANALYSIS_MODEL = "gpt-4o-mini"
+    # Model and request settings used for per-statement explanations
+    EXPLANATION_MODEL = "gpt-3.5-turbo"
+    EXPLANATION_MAX_TOKENS = 100
+    EXPLANATION_TEMPERATURE = 0.2
+    # Static prompt parts, kept as a fixed prefix so requests share it verbatim
+    EXPLANATION_SYSTEM_MESSAGE = {
+        "role": "system",
+        "content": "AWS security expert. Give concise IAM explanations.",
+    }
+    EXPLANATION_FOCUS = "Focus on: what it allows and security implications."
+    GROUP_EXPLANATION_INSTRUCTIONS = (
+        "Explain each IAM statement below in 2-3 sentences.\n"
+        f"{EXPLANATION_FOCUS}\n"
+        'Respond with JSON: {"results": [{"index": <number>, "explanation": "<text>"}]}\n'
+        "Include one result for every index."
+    )
+    # Maximum number of statement explanations requested in parallel
+    MAX_CONCURRENCY = 10
+    # Number of statement explanations packed into a single request
+    EXPLANATION_GROUP_SIZE = 10
+    # Policies this small get their explanations from the verification request itself
+    COMBINED_EXPLANATION_MAX_STATEMENTS = 3
+    # Smallest statement set worth sending through the Batch API
+    BATCH_MIN_STATEMENTS = 20
+    # Initial and maximum delay in seconds between Batch API status checks
+    BATCH_POLL_INTERVAL = 5.0
+    BATCH_MAX_POLL_INTERVAL = 60.0
+    # Seconds to wait for a batch before cancelling it and using the concurrent path
+    BATCH_MAX_WAIT = 30 * 60.0
+
+    def __init__(
+        self,
+        api_key: str,
+        cache_dir: str = ".tfiam-cache",
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+    ):
+        self.client = openai.OpenAI(api_key=api_key, http_client=_shared_http_client())
         self.cache = AIResponseCache(cache_dir)
+        self.rate_limiter = RateLimiter(
+            requests_per_minute or RateLimiter.DEFAULT_REQUESTS_PER_MINUTE,
+            tokens_per_minute or RateLimiter.DEFAULT_TOKENS_PER_MINUTE,
+        )
         self.cache_hits = 0
         self.cache_misses = 0
+        # Explanation workers and the background verification update the counters concurrently
+        self._stats_lock = threading.Lock()
+        self._send_completion = retry_with_backoff(
+            self.client.chat.completions.create,
+            retry_on=(openai.RateLimitError, openai.InternalServerError),
+        )
+
+    def _create_chat_completion(self, **kwargs):
+        """Create a chat completion within the request/token budget, retrying on 429s and 5xx."""
+        # Rough estimate: ~4 characters per prompt token plus the completion budget
+        prompt_chars = sum(len(message["content"]) for message in kwargs["messages"])
+        self.rate_limiter.acquire(prompt_chars // 4 + kwargs.get("max_tokens", 0))
+        return self._send_completion(**kwargs)
+
+    def clear_cache(self) -> None:
+        """Clear all cached AI responses."""
+        self.cache.clear()
 
     def enhance_statements(self, statements: List[IAMStatement]) -> List[IAMStatement]:
         """Enhance statements with AI-generated explanations."""
@@ -69,10 +143,9 @@ class OpenAIAnalyzer:
 
         # Create cache data for verification
         verification_data = {
+            "model": self.ANALYSIS_MODEL,
             "terraform_resources": [f"{r.type}:{r.name}" for r in terraform_resources],
-            "policy_statements": [
-                f"{s.sid}:{s.effect}:{','.join(s.action[:3])}" for s in statements
-            ],
+            "policy_statements": self._statement_fingerprints(statements),
             "terraform_content": terraform_content,
         }
 
@@ -85,10 +158,17 @@ class OpenAIAnalyzer:
             # Parse the cached response into structured recommendations
             recommendations = self._parse_verification_response(cached_response)
 
+            # The policy generated alongside this analysis was cached with it, so a warm
+            # run needs no further request for optimization either
+            cached_policy = self.cache.get_optimization(
+                self._optimization_cache_data(statements, terraform_resources, cached_response)
+            )
+
             return {
                 "verification_passed": recommendations.get("verification_passed", True),
                 "recommendations": recommendations,
                 "raw_analysis": cached_response,
+                "optimized_policy": cached_policy,
                 "policy_statistics": self._calculate_policy_statistics(statements),
                 "terraform_statistics": self._calculate_terraform_statistics(terraform_resources),
             }
@@ -98,21 +178,22 @@ class OpenAIAnalyzer:
         terraform_summary = self._create_terraform_summary(terraform_resources, terraform_content)
 
         # Generate comprehensive verification prompt
+        include_explanations = len(statements) <= self.COMBINED_EXPLANATION_MAX_STATEMENTS
         verification_prompt = self._create_verification_prompt(
-            policy_summary, terraform_summary, statements
+            policy_summary, terraform_summary, statements, include_explanations
         )
 
         try:
             # Start loading spinner for verification
             spinner = None
             if not quiet:
-                from ..cli.cyber_cli import CyberCLI
+                from ..cli.cyber_cli import CyberCLI, create_loading_spinner
 
-                spinner = CyberCLI.create_loading_spinner("🔍 AI Analyzing Policy", CyberCLI.CYAN)
+                spinner = create_loading_spinner("🔍 AI Analyzing Policy", CyberCLI.CYAN)
                 spinner.start()
 
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",  # Use more capable model for complex analysis
+            response = self._create_chat_completion(
+                model=self.ANALYSIS_MODEL,  # Use more capable model for complex analysis
                 messages=[
                     {
                         "role": "system",
@@ -125,16 +206,23 @@ class OpenAIAnalyzer:
                         4. Optimization opportunities - how can permissions be improved?
                         5. Best practices - adherence to AWS security best practices.
 
-                        Provide specific, actionable feedback.""",
+                        Provide specific, actionable feedback, then an optimized policy that applies it.
+                        Always respond with a single JSON object.""",
                     },
                     {"role": "user", "content": verification_prompt},
                 ],
-                max_tokens=800,
+                max_tokens=2800,  # Room for the analysis and the optimized policy
                 temperature=0.1,  # Low temperature for consistent analysis
-                timeout=30,
+                response_format={"type": "json_object"},
+                timeout=60,
             )
 
-            verification_result = response.choices[0].message.content.strip()
+            response_text = response.choices[0].message.content.strip()
+            verification_result, optimized_policy_json = self._split_combined_response(
+                response_text
+            )
+            if include_explanations:
+                self._cache_combined_explanations(statements, response_text)
 
             # Stop loading spinner
             if spinner:
@@ -143,6 +231,14 @@ class OpenAIAnalyzer:
             # Cache the response (handle Unicode issues)
             try:
                 self.cache.set_verification(verification_data, verification_result)
+                if optimized_policy_json:
+                    # Store the policy where generate_optimized_policy will look for it
+                    self.cache.set_optimization(
+                        self._optimization_cache_data(
+                            statements, terraform_resources, verification_result
+                        ),
+                        optimized_policy_json,
+                    )
             except UnicodeEncodeError:
                 if not quiet:
                     print(f"  ⚠️  Could not cache verification response due to encoding issues")
@@ -154,6 +250,7 @@ class OpenAIAnalyzer:
                 "verification_passed": recommendations.get("verification_passed", True),
                 "recommendations": recommendations,
                 "raw_analysis": verification_result,
+                "optimized_policy": optimized_policy_json,
                 "policy_statistics": self._calculate_policy_statistics(statements),
                 "terraform_statistics": self._calculate_terraform_statistics(terraform_resources),
             }
@@ -180,70 +277,183 @@ class OpenAIAnalyzer:
     ) -> List[IAMStatement]:
         """Enhance statements with AI-generated explanations and progress tracking."""
         total = len(statements)
-        enhanced_statements = [None] * total  # Pre-allocate list
+        enhanced_statements = list(statements)  # Failed statements keep their default explanation
+        completed = 0
+
+        # Cached explanations need no request at all
+        uncached_indices = []
+        for i, statement in enumerate(statements):
+            cached_response = self.cache.get(self._statement_cache_data(statement))
+            if cached_response:
+                self._count_cache_lookups(hits=1)
+                enhanced_statements[i] = self._with_explanation(statement, cached_response)
+                completed += 1
+                if not quiet:
+                    print(f"  {completed}/{total} - Analyzed {statement.sid} 📦 ✓ (0.0s)")
+            else:
+                uncached_indices.append(i)
 
-        # Use concurrent processing for better performance
-        max_workers = min(5, total)  # Limit concurrent requests
+        def process_group(indices):
+            start_time = time.time()
+            try:
+                explanations = self._generate_group_explanations([statements[i] for i in indices])
+            except Exception:
+                explanations = {}  # Fall back to one request per statement below
 
-        def process_statement(indexed_statement):
-            i, statement = indexed_statement
-            if not quiet:
-                print(f"  {i+1}/{total} - Analyzing {statement.sid}...", end=" ", flush=True)
+            results = {}
+            for position, i in enumerate(indices):
+                try:
+                    results[i] = explanations.get(position) or self._generate_explanation(
+                        statements[i]
+                    )
+                except Exception as e:
+                    results[i] = e
+            return results, time.time() - start_time
+
+        # Several statements share one request; groups run concurrently within the rate limit
+        groups = [
+            uncached_indices[start : start + self.EXPLANATION_GROUP_SIZE]
+            for start in range(0, len(uncached_indices), self.EXPLANATION_GROUP_SIZE)
+        ]
+        max_workers = max(1, min(self.MAX_CONCURRENCY, len(groups)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(process_group, group) for group in groups]
+
+            # Report progress from this thread as results complete so lines never interleave
+            for future in as_completed(futures):
+                results, duration = future.result()
+                for index, result in results.items():
+                    completed += 1
+                    sid = statements[index].sid
+                    if isinstance(result, Exception):
+                        if not quiet:
+                            print(
+                                f"  {completed}/{total} - Analyzed {sid} ✗ - {str(result)[:50]}..."
+                            )
+                        continue
+                    enhanced_statements[index] = self._with_explanation(statements[index], result)
+                    if not quiet:
+                        print(f"  {completed}/{total} - Analyzed {sid} 🌐 ✓ ({duration:.1f}s)")
 
-            start_time = time.time()
+        return enhanced_statements
 
-            try:
-                # Check if this will be a cache hit before generating
-                statement_data = {
-                    "sid": statement.sid,
-                    "effect": statement.effect,
-                    "action": statement.action,
-                    "resource": statement.resource,
-                }
-                is_cache_hit = self.cache.get(statement_data) is not None
+    def enhance_statements_batch(
+        self, statements: List[IAMStatement], quiet: bool = False
+    ) -> List[IAMStatement]:
+        """
+        Enhance statements through the OpenAI Batch API.
 
-                explanation = self._generate_explanation(statement)
-                enhanced_statement = IAMStatement(
-                    sid=statement.sid,
-                    effect=statement.effect,
-                    action=statement.action,
-                    resource=statement.resource,
-                    explanation=explanation,
+        Batch requests cost half as much and draw on a separate rate limit pool, but may
+        take a while to complete. Small statement sets and failed batches use the
+        concurrent path instead.
+
+        Args:
+            statements: IAM statements to explain
+            quiet: Whether to suppress progress output
+
+        Returns:
+            Statements with AI-generated explanations
+        """
+        if len(statements) < self.BATCH_MIN_STATEMENTS:
+            return self.enhance_statements_with_progress(statements, quiet)
+
+        explanations = {}
+        pending = {}
+        for i, statement in enumerate(statements):
+            cached_response = self.cache.get(self._statement_cache_data(statement))
+            if cached_response:
+                explanations[i] = cached_response
+            else:
+                pending[f"statement-{i}"] = i
+
+        if pending:
+            batch_lines = [
+                json.dumps(
+                    {
+                        "custom_id": custom_id,
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": self._explanation_request(statements[i]),
+                    }
                 )
+                for custom_id, i in pending.items()
+            ]
+            output = self._run_explanation_batch(batch_lines, quiet)
+            if output is None:
+                # The concurrent path counts its own cache hits and misses
+                return self.enhance_statements_with_progress(statements, quiet)
+
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                index = pending.get(record.get("custom_id"))
+                response = record.get("response") or {}
+                if index is None or response.get("status_code") != 200:
+                    continue
+                explanation = response["body"]["choices"][0]["message"]["content"].strip()
+                self.cache.set(self._statement_cache_data(statements[index]), explanation)
+                explanations[index] = explanation
 
-                if not quiet:
-                    duration = time.time() - start_time
-                    cache_indicator = "📦" if is_cache_hit else "🌐"
-                    print(f"{cache_indicator} ✓ ({duration:.1f}s)")
+            if not quiet:
+                print(f"  ✓ Batch explained {len(explanations)}/{len(statements)} statements")
 
-                return i, enhanced_statement
+        self._count_cache_lookups(hits=len(statements) - len(pending), misses=len(pending))
 
-            except Exception as e:
-                if not quiet:
-                    duration = time.time() - start_time
-                    print(f"✗ ({duration:.1f}s) - {str(e)[:50]}...")
+        return [
+            self._with_explanation(statement, explanations[i]) if i in explanations else statement
+            for i, statement in enumerate(statements)
+        ]
 
-                # Use original statement with default explanation
-                return i, statement
+    def _run_explanation_batch(self, batch_lines: List[str], quiet: bool) -> Optional[str]:
+        """
+        Submit explanation requests as a batch and wait for its results.
 
-        # Process statements concurrently
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_index = {
-                executor.submit(process_statement, (i, stmt)): i
-                for i, stmt in enumerate(statements)
-            }
+        Args:
+            batch_lines: JSONL request lines for the batch input file
+            quiet: Whether to suppress progress output
 
-            # Collect results as they complete
-            for future in as_completed(future_to_index):
-                try:
-                    index, enhanced_statement = future.result()
-                    enhanced_statements[index] = enhanced_statement
-                except Exception as e:
+        Returns:
+            Content of the batch output file, or None if the batch failed or took too long
+        """
+        try:
+            batch_file = self.client.files.create(
+                file=("tfiam-explanations.jsonl", "\n".join(batch_lines).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            if not quiet:
+                print(f"  📨 Submitted batch {batch.id} with {len(batch_lines)} statements")
+
+            # Poll with exponential backoff until the batch reaches a terminal state
+            deadline = time.monotonic() + self.BATCH_MAX_WAIT
+            delay = self.BATCH_POLL_INTERVAL
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    # Nobody waits for the results any more, so stop paying for them
+                    self.client.batches.cancel(batch.id)
                     if not quiet:
-                        print(f"Unexpected error: {e}")
+                        print(f"  ⚠️  Batch {batch.id} did not finish in time, falling back")
+                    return None
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, self.BATCH_MAX_POLL_INTERVAL)
+                batch = self.client.batches.retrieve(batch.id)
 
-        return enhanced_statements
+            if batch.status != "completed" or not batch.output_file_id:
+                if not quiet:
+                    print(f"  ⚠️  Batch {batch.id} ended as {batch.status}, falling back")
+                return None
+
+            return self.client.files.content(batch.output_file_id).text
+        except openai.OpenAIError as e:
+            if not quiet:
+                print(f"  ⚠️  Batch request failed, falling back: {e}")
+            return None
 
     def generate_optimized_policy(
         self,
@@ -264,14 +474,14 @@ class OpenAIAnalyzer:
         Returns:
             Optimized IAM policy as JSON string
         """
+        # The combined verification request usually returns the policy already
+        if verification_result.get("optimized_policy"):
+            return verification_result["optimized_policy"]
+
         # Create cache data for optimization
-        optimization_data = {
-            "terraform_resources": [f"{r.type}:{r.name}" for r in terraform_resources],
-            "policy_statements": [
-                f"{s.sid}:{s.effect}:{','.join(s.action[:3])}" for s in statements
-            ],
-            "verification_analysis": verification_result.get("raw_analysis", ""),
-        }
+        optimization_data = self._optimization_cache_data(
+            statements, terraform_resources, verification_result.get("raw_analysis", "")
+        )
 
         # Check cache first
         cached_response = self.cache.get_optimization(optimization_data)
@@ -280,6 +490,16 @@ class OpenAIAnalyzer:
                 print(f"  📦 Using cached optimization response")
             return cached_response
 
+        # Fall back to a policy generated for the same grants. The analysis text differs from
+        # run to run, so this catches repeats the exact key misses, while a policy is still
+        # only reused for exactly the same effect, action and resource combinations
+        grants_data = {"model": self.ANALYSIS_MODEL, "grants": self._policy_grants(statements)}
+        cached_response = self.cache.get(grants_data, "policy_grants")
+        if cached_response:
+            if not quiet:
+                print(f"  📦 Using cached optimization response for the same permissions")
+            return cached_response
+
         # Generate optimization prompt
         optimization_prompt = f"""
 You are an AWS security expert. Generate a complete, valid JSON IAM policy based on the analysis below.
@@ -328,15 +548,15 @@ IMPORTANT:
             # Start loading spinner for AI optimization
             spinner = None
             if not quiet:
-                from ..cli.cyber_cli import CyberCLI
+                from ..cli.cyber_cli import CyberCLI, create_loading_spinner
 
-                spinner = CyberCLI.create_loading_spinner(
+                spinner = create_loading_spinner(
                     "🤖 AI Generating Optimized Policy", CyberCLI.MAGENTA
                 )
                 spinner.start()
 
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
+            response = self._create_chat_completion(
+                model=self.ANALYSIS_MODEL,
                 messages=[
                     {
                         "role": "system",
@@ -345,10 +565,10 @@ IMPORTANT:
                     {"role": "user", "content": optimization_prompt},
                 ],
                 max_tokens=2000,  # Increased to ensure complete response
-                temperature=0.1,
+                temperature=0.0,
+                response_format={"type": "json_object"},  # Guarantees a parseable JSON object
                 timeout=60,  # Increased timeout for larger responses
             )
-
             optimized_policy_json = response.choices[0].message.content.strip()
 
             # Stop loading spinner
@@ -358,6 +578,7 @@ IMPORTANT:
             # Cache the response (handle Unicode issues)
             try:
                 self.cache.set_optimization(optimization_data, optimized_policy_json)
+                self.cache.set(grants_data, optimized_policy_json, "policy_grants")
             except UnicodeEncodeError:
                 if not quiet:
                     print(f"  ⚠️  Could not cache optimization response due to encoding issues")
@@ -374,6 +595,62 @@ IMPORTANT:
                 print(f"{CyberCLI.YELLOW}Warning: Policy optimization failed: {e}{CyberCLI.END}")
             raise e
 
+    def _optimization_cache_data(
+        self,
+        statements: List[IAMStatement],
+        terraform_resources: List[TerraformResource],
+        verification_analysis: str,
+    ) -> Dict[str, Any]:
+        """Build the cache data identifying an optimization request."""
+        return {
+            "model": self.ANALYSIS_MODEL,
+            "terraform_resources": [f"{r.type}:{r.name}" for r in terraform_resources],
+            "policy_statements": self._statement_fingerprints(statements),
+            "verification_analysis": verification_analysis,
+        }
+
+    @staticmethod
+    def _split_combined_response(response: str) -> Tuple[str, Optional[str]]:
+        """Split a combined verification response into analysis text and policy JSON."""
+        try:
+            data = json.loads(response)
+        except json.JSONDecodeError:
+            # Plain-text analysis without an optimized policy
+            return response, None
+
+        if not isinstance(data, dict):
+            return response, None
+
+        analysis = data.get("analysis", "")
+        if not isinstance(analysis, str):
+            analysis = json.dumps(analysis, indent=2, ensure_ascii=False)
+
+        policy = data.get("optimized_policy")
+        policy_json = json.dumps(policy, indent=2, ensure_ascii=False) if policy else None
+        return analysis.strip() or response, policy_json
+
+    def _cache_combined_explanations(self, statements: List[IAMStatement], response: str) -> None:
+        """Cache statement explanations returned alongside a verification analysis."""
+        try:
+            explanations = json.loads(response).get("explanations")
+        except (json.JSONDecodeError, AttributeError):
+            return
+        if not isinstance(explanations, dict):
+            return
+
+        for statement in statements:
+            explanation = explanations.get(statement.sid)
+            if isinstance(explanation, str) and explanation.strip():
+                self.cache.set(self._statement_cache_data(statement), explanation.strip())
+
+    @staticmethod
+    def _statement_fingerprints(statements: List[IAMStatement]) -> List[str]:
+        """Build canonical per-statement strings covering every action and resource."""
+        return [
+            f"{s.sid}:{s.effect}:{','.join(sorted(s.action))}:{','.join(sorted(s.resource))}"
+            for s in statements
+        ]
+
     def _format_statements_for_ai(self, statements):
         """Format IAM statements for AI analysis."""
         formatted = []
@@ -386,6 +663,18 @@ IMPORTANT:
             formatted.append("")
         return "\n".join(formatted)
 
+    @staticmethod
+    def _policy_grants(statements: List[IAMStatement]) -> List[str]:
+        """List every effect, action and resource combination the statements grant."""
+        return sorted(
+            {
+                f"{stmt.effect}:{action}:{resource}"
+                for stmt in statements
+                for action in stmt.action
+                for resource in stmt.resource
+            }
+        )
+
     def get_cache_stats(self) -> dict:
         """Get cache statistics."""
         stats = self.cache.get_stats()
@@ -401,48 +690,112 @@ IMPORTANT:
         )
         return stats
 
-    def _generate_explanation(self, statement: IAMStatement) -> str:
-        """Generate AI explanation for a statement."""
-        # Create statement data for cache key generation
-        statement_data = {
+    @staticmethod
+    def _statement_cache_data(statement: IAMStatement) -> Dict[str, Any]:
+        """Build the cache key data for a statement explanation."""
+        return {
             "sid": statement.sid,
             "effect": statement.effect,
             "action": statement.action,
             "resource": statement.resource,
         }
 
-        # Check cache first
-        cached_response = self.cache.get(statement_data)
-        if cached_response:
-            self.cache_hits += 1
-            return cached_response
-
-        self.cache_misses += 1
-
+    @staticmethod
+    def _statement_details(statement: IAMStatement) -> str:
+        """Format the per-statement part of an explanation prompt."""
         # Optimized prompt - shorter and more focused
         actions_str = ", ".join(statement.action[:5])  # Limit to first 5 actions
         if len(statement.action) > 5:
             actions_str += f" (+{len(statement.action) - 5} more)"
 
-        prompt = f"""Explain this IAM statement in 2-3 sentences:
-SID: {statement.sid}
+        return f"""SID: {statement.sid}
 Actions: {actions_str}
-Resources: {statement.resource[0] if statement.resource else 'N/A'}
-
-Focus on: what it allows and security implications."""
-
-        response = self.client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "AWS security expert. Give concise IAM explanations.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            max_tokens=100,  # Reduced from 150
-            temperature=0.2,  # Reduced for consistency
-            timeout=10,  # Add timeout
+Resources: {statement.resource[0] if statement.resource else 'N/A'}"""
+
+    def _explanation_request(self, statement: IAMStatement) -> Dict[str, Any]:
+        """Build the chat completion request body for a statement explanation."""
+        prompt = f"""Explain this IAM statement in 2-3 sentences:
+{self._statement_details(statement)}
+
+{self.EXPLANATION_FOCUS}"""
+
+        return {
+            "model": self.EXPLANATION_MODEL,
+            "messages": [self.EXPLANATION_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            "max_tokens": self.EXPLANATION_MAX_TOKENS,
+            "temperature": self.EXPLANATION_TEMPERATURE,
+        }
+
+    @staticmethod
+    def _with_explanation(statement: IAMStatement, explanation: str) -> IAMStatement:
+        """Return a copy of the statement carrying the given explanation."""
+        return IAMStatement(
+            sid=statement.sid,
+            effect=statement.effect,
+            action=statement.action,
+            resource=statement.resource,
+            explanation=explanation,
+        )
+
+    def _generate_group_explanations(self, statements: List[IAMStatement]) -> Dict[int, str]:
+        """
+        Explain several statements with a single request.
+
+        Returns a mapping from position in ``statements`` to explanation. Statements
+        missing from the response are left out so callers can request them one by one.
+        """
+        if len(statements) == 1:
+            return {0: self._generate_explanation(statements[0])}
+
+        # Instructions are stated once up front; only the statement details vary
+        statement_prompts = "\n\n".join(
+            f"[{i}]\n{self._statement_details(statement)}" for i, statement in enumerate(statements)
+        )
+        prompt = f"{self.GROUP_EXPLANATION_INSTRUCTIONS}\n\n{statement_prompts}"
+
+        response = self._create_chat_completion(
+            model=self.EXPLANATION_MODEL,
+            messages=[self.EXPLANATION_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            max_tokens=self.EXPLANATION_MAX_TOKENS * len(statements) + 50,
+            temperature=self.EXPLANATION_TEMPERATURE,
+            response_format={"type": "json_object"},
+            timeout=30,
+        )
+
+        explanations = {}
+        results = json.loads(response.choices[0].message.content).get("results", [])
+        for result in results:
+            index = result.get("index")
+            explanation = str(result.get("explanation", "")).strip()
+            if isinstance(index, int) and 0 <= index < len(statements) and explanation:
+                explanations[index] = explanation
+
+        for index, explanation in explanations.items():
+            self.cache.set(self._statement_cache_data(statements[index]), explanation)
+        self._count_cache_lookups(misses=len(explanations))
+
+        return explanations
+
+    def _count_cache_lookups(self, hits: int = 0, misses: int = 0) -> None:
+        """Add to the cache hit and miss counters from any thread."""
+        with self._stats_lock:
+            self.cache_hits += hits
+            self.cache_misses += misses
+
+    def _generate_explanation(self, statement: IAMStatement) -> str:
+        """Generate AI explanation for a statement."""
+        statement_data = self._statement_cache_data(statement)
+
+        # Check cache first
+        cached_response = self.cache.get(statement_data)
+        if cached_response:
+            self._count_cache_lookups(hits=1)
+            return cached_response
+
+        self._count_cache_lookups(misses=1)
+
+        response = self._create_chat_completion(
+            **self._explanation_request(statement), timeout=10  # Add timeout
         )
 
         explanation = response.choices[0].message.content.strip()
@@ -490,9 +843,7 @@ Policy Summary:
         resource_counts = {}
 
         for resource in resources:
-            service = (
-                resource.type.split("_")[1] if len(resource.type.split("_")) > 1 else "unknown"
-            )
+            service = resource.service if "_" in resource.type else "unknown"
             services.add(service)
             resource_counts[resource.type] = resource_counts.get(resource.type, 0) + 1
 
@@ -527,9 +878,19 @@ Terraform Summary:
         return ", ".join(patterns) if patterns else "standard configuration"
 
     def _create_verification_prompt(
-        self, policy_summary: str, terraform_summary: str, statements: List[IAMStatement]
+        self,
+        policy_summary: str,
+        terraform_summary: str,
+        statements: List[IAMStatement],
+        include_explanations: bool = False,
     ) -> str:
         """Create a comprehensive verification prompt for AI analysis."""
+        explanations_field = (
+            '\n- "explanations": an object mapping each statement Sid to a 2-3 sentence '
+            "explanation of what it allows and its security implications"
+            if include_explanations
+            else ""
+        )
 
         # Create detailed statement breakdown
         statement_details = []
@@ -567,7 +928,17 @@ Please analyze and provide:
 4. **Optimization Opportunities**: How can this policy be improved?
 5. **Best Practice Compliance**: Does this follow AWS security best practices?
 
-Format your response with clear sections and actionable recommendations.
+Then generate an optimized IAM policy that applies your recommendations:
+- Apply the principle of least privilege and use specific resource ARNs where possible
+- Remove unnecessary permissions and group related permissions efficiently
+- Ensure all Terraform resources are properly covered
+
+Current IAM statements:
+{self._format_statements_for_ai(statements)}
+
+Respond with a JSON object with these fields:
+- "analysis": your analysis as Markdown text with clear sections and bullet-point recommendations
+- "optimized_policy": the complete IAM policy object ({{"Version": "2012-10-17", "Statement": [...]}}){explanations_field}
 """
 
         return prompt
@@ -651,9 +1022,7 @@ Format your response with clear sections and actionable recommendations.
         resource_types = {}
 
         for resource in resources:
-            service = (
-                resource.type.split("_")[1] if len(resource.type.split("_")) > 1 else "unknown"
-            )
+            service = resource.service if "_" in resource.type else "unknown"
             services.add(service)
             resource_types[resource.type] = resource_types.get(resource.type, 0) + 1
 
@@ -7,6 +7,14 @@ from typing import Any, Dict, List
 
 from .models import IAMStatement
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder produces the same output
+    orjson = None
+
+# Buffer size for report writes so a whole report is flushed in a few syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 class PolicyGenerator:
     """Generates IAM policies and analysis reports."""
@@ -27,8 +35,12 @@ class PolicyGenerator:
             }
             policy["Statement"].append(statement_dict)
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(policy, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(policy, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(json.dumps(policy, indent=2, ensure_ascii=False))
 
         return os.path.getsize(filename)
 
@@ -37,7 +49,7 @@ class PolicyGenerator:
         statements: List[IAMStatement], analysis_metadata: Dict[str, Any], filename: str
     ) -> int:
         """Save detailed Markdown report with AI explanations."""
-        with open(filename, "w", encoding="utf-8") as f:
+        with open(filename, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
             f.write("# TFIAM Analysis Report\n\n")
             f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write(
@@ -45,7 +57,10 @@ class PolicyGenerator:
             )
             f.write(f"**Services Analyzed:** {analysis_metadata.get('services_count', 0)}\n")
             f.write(f"**Total Statements:** {len(statements)}\n")
-            f.write(f"**Total Permissions:** {sum(len(stmt.action) for stmt in statements)}\n")
+            permissions_count = analysis_metadata.get("permissions_count")
+            if permissions_count is None:
+                permissions_count = sum(len(stmt.action) for stmt in statements)
+            f.write(f"**Total Permissions:** {permissions_count}\n")
 
             # Add verification results if available
             verification_results = analysis_metadata.get("verification_results", {})
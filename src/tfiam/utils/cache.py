@@ -3,6 +3,8 @@
 import hashlib
 import json
 import os
+import threading
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
@@ -10,12 +12,18 @@ from typing import Any, Dict, Optional
 class AIResponseCache:
     """File-based cache for AI responses to reduce API costs."""
 
-    def __init__(self, cache_dir: str = ".tfiam-cache"):
-        """Initialize the cache with a specified directory."""
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
+    # Entries older than this many seconds are treated as misses (30 days)
+    DEFAULT_MAX_AGE = 30 * 24 * 60 * 60
+
+    def __init__(self, cache_dir: str = ".tfiam-cache", max_age: Optional[float] = DEFAULT_MAX_AGE):
+        """Initialize the cache with a specified directory and entry lifetime."""
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_file = self.cache_dir / "ai_responses.json"
+        self.max_age = max_age
         self.cache_data = self._load_cache()
+        # Responses are written from several worker threads at once
+        self._lock = threading.Lock()
 
     def _load_cache(self) -> Dict[str, Any]:
         """Load cache data from file."""
@@ -63,6 +71,7 @@ class AIResponseCache:
             # Create a normalized representation of the optimization request
             normalized_data = {
                 "type": "optimization",
+                "model": data.get("model", ""),
                 "terraform_resources": sorted(data.get("terraform_resources", [])),
                 "policy_statements": sorted(data.get("policy_statements", [])),
                 "verification_analysis": data.get("verification_analysis", ""),
@@ -71,11 +80,12 @@ class AIResponseCache:
             # Create a normalized representation of the verification request
             normalized_data = {
                 "type": "verification",
+                "model": data.get("model", ""),
                 "terraform_resources": sorted(data.get("terraform_resources", [])),
                 "policy_statements": sorted(data.get("policy_statements", [])),
                 "terraform_content_hash": hashlib.sha256(
                     data.get("terraform_content", "").encode()
-                ).hexdigest()[:8],
+                ).hexdigest(),
             }
         else:
             # Generic fallback
@@ -88,13 +98,20 @@ class AIResponseCache:
     def get(self, data: Dict[str, Any], cache_type: str = "statement") -> Optional[str]:
         """Get cached AI response for data."""
         cache_key = self._generate_cache_key(data, cache_type)
-        return self.cache_data.get(cache_key)
+        entry = self.cache_data.get(cache_key)
+        if not isinstance(entry, dict):
+            # Entries written before expiry was tracked are plain response strings
+            return entry
+        if self.max_age is not None and time.time() - entry.get("created", 0) > self.max_age:
+            return None
+        return entry.get("response")
 
     def set(self, data: Dict[str, Any], response: str, cache_type: str = "statement") -> None:
         """Cache an AI response for data."""
         cache_key = self._generate_cache_key(data, cache_type)
-        self.cache_data[cache_key] = response
-        self._save_cache()
+        with self._lock:
+            self.cache_data[cache_key] = {"response": response, "created": time.time()}
+            self._save_cache()
 
     def get_optimization(self, optimization_data: Dict[str, Any]) -> Optional[str]:
         """Get cached optimization response."""
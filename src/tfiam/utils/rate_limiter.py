@@ -0,0 +1,80 @@
+"""Rate limiting utilities for OpenAI API requests."""
+
+import threading
+import time
+from typing import Any, Callable, Tuple, Type
+
+
+class RateLimiter:
+    """Thread-safe token-bucket limiter for requests and tokens per minute."""
+
+    # Conservative defaults that fit the lowest gpt-4o-mini usage tier
+    DEFAULT_REQUESTS_PER_MINUTE = 500
+    DEFAULT_TOKENS_PER_MINUTE = 60000
+
+    def __init__(
+        self,
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE,
+    ):
+        """Initialize the limiter with per-minute request and token budgets."""
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._available_requests = float(requests_per_minute)
+        self._available_tokens = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Refill both buckets based on the time elapsed since the last refill."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._available_requests = min(
+            float(self.requests_per_minute),
+            self._available_requests + elapsed * self.requests_per_minute / 60,
+        )
+        self._available_tokens = min(
+            float(self.tokens_per_minute),
+            self._available_tokens + elapsed * self.tokens_per_minute / 60,
+        )
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until a request using the given number of tokens fits in the budget."""
+        # A single request larger than the whole budget must still be able to run
+        tokens = min(tokens, self.tokens_per_minute)
+
+        while True:
+            with self._lock:
+                self._refill()
+                if self._available_requests >= 1 and self._available_tokens >= tokens:
+                    self._available_requests -= 1
+                    self._available_tokens -= tokens
+                    return
+
+                request_wait = (1 - self._available_requests) * 60 / self.requests_per_minute
+                token_wait = (tokens - self._available_tokens) * 60 / self.tokens_per_minute
+                wait = max(request_wait, token_wait, 0.01)
+
+            time.sleep(wait)
+
+
+def retry_with_backoff(
+    func: Callable[..., Any],
+    retry_on: Tuple[Type[BaseException], ...],
+    max_retries: int = 6,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+) -> Callable[..., Any]:
+    """Wrap a function so it retries with exponential backoff on the given exceptions."""
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        for attempt in range(max_retries + 1):
+            try:
+                return func(*args, **kwargs)
+            except retry_on:
+                if attempt == max_retries:
+                    raise
+                time.sleep(min(max_delay, base_delay * (2**attempt)))
+
+    return wrapper
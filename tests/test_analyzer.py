@@ -46,6 +46,22 @@ class TestTerraformAnalyzer:
         assert "var.environment" in self.analyzer.variables
         assert self.analyzer.variables["var.environment"] == "prod"
 
+    def test_extract_variable_default_after_nested_block(self):
+        """Test a default declared after a nested type or validation block is found."""
+        content = """
+        variable "settings" {
+          type = object({ name = string })
+          validation {
+            condition = length(var.settings.name) > 0
+          }
+          default = "fallback"
+        }
+        """
+
+        self.analyzer.extract_variables_and_locals(content)
+
+        assert self.analyzer.variables["var.settings"] == "fallback"
+
     def test_extract_locals(self):
         """Test locals extraction from Terraform content."""
         content = """
@@ -76,6 +92,17 @@ class TestTerraformAnalyzer:
         result = self.analyzer.resolve_variable_reference("${local.name_prefix}")
         assert result == "my-project-prod"
 
+    def test_resolve_bare_and_data_references(self):
+        """Test bare var/local references and data sources resolve in one string."""
+        self.analyzer.variables["var.env"] = "prod"
+        self.analyzer.variables["var.environment"] = "staging"
+        self.analyzer.locals["local.app"] = "${var.env}-app"
+
+        result = self.analyzer.resolve_variable_reference(
+            "var.environment/local.app/${data.aws_caller_identity.current}"
+        )
+        assert result == "staging/prod-app/aws_caller_identity.current-*"
+
     def test_dynamic_permissions_generation(self):
         """Test dynamic permissions generation for unknown services."""
         actions = self.analyzer._generate_generic_permissions("newservice", "resource")
@@ -145,6 +172,50 @@ class TestTerraformAnalyzer:
             assert role_resource.name == "test"
             assert role_resource.resource_name == "test-role"
 
+            # Scanned sources are kept for AI verification
+            assert self.analyzer.get_combined_content() == test_tf_content + "\n\n"
+
+    def test_resources_resolve_values_declared_later_in_file(self):
+        """Test resource names use variables and locals defined after the resource block."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "main.tf"), "w") as f:
+                f.write(
+                    'resource "aws_s3_bucket" "data" {\n'
+                    '  bucket = "${local.prefix}-data"\n'
+                    "}\n"
+                    'resource "google_storage_bucket" "other" {\n'
+                    '  name = "ignored"\n'
+                    "}\n"
+                    'variable "project" {\n'
+                    '  default = "demo"\n'
+                    "}\n"
+                    "locals {\n"
+                    '  prefix = "${var.project}-prod"\n'
+                    "}\n"
+                )
+
+            self.analyzer.scan_directory(temp_dir)
+
+            assert [r.type for r in self.analyzer.resources] == ["aws_s3_bucket"]
+            assert self.analyzer.resources[0].resource_name == "demo-prod-data"
+
+    def test_process_pool_parsing_matches_in_process(self):
+        """Test parsing files in worker processes gives the same resources as in-process."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "variables.tf"), "w") as f:
+                f.write('variable "env" {\n  default = "prod"\n}\n')
+            with open(os.path.join(temp_dir, "main.tf"), "w") as f:
+                f.write('resource "aws_s3_bucket" "logs" {\n  bucket = "${var.env}-logs"\n}\n')
+
+            self.analyzer.scan_directory(temp_dir, ["variables.tf", "main.tf"])
+            pooled = TerraformAnalyzer()
+            pooled.PROCESS_POOL_MIN_FILES = 1
+            pooled.scan_directory(temp_dir, ["variables.tf", "main.tf"])
+
+            assert [r.resource_name for r in pooled.resources] == ["prod-logs"]
+            assert pooled.resources == self.analyzer.resources
+            assert pooled.variables == self.analyzer.variables
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,101 @@
+"""Tests for OpenAIAnalyzer caching."""
+
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tfiam.core.models import IAMStatement, TerraformResource
+from tfiam.core.openai_analyzer import OpenAIAnalyzer
+
+
+def _response(content):
+    """Build a minimal chat completion response."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class TestOpenAIAnalyzerCache:
+    """Test cases for OpenAIAnalyzer cache keys."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.analyzer = OpenAIAnalyzer("test-key", cache_dir=self.temp_dir.name)
+        self.resources = [TerraformResource("aws_s3_bucket", "data")]
+        self.statements = [
+            IAMStatement("A", "Allow", ["s3:GetObject"], ["arn:x"]),
+            IAMStatement("B", "Allow", ["s3:GetObject"], ["arn:y"]),
+        ]
+        self.swapped = [
+            IAMStatement("A", "Allow", ["s3:GetObject"], ["arn:y"]),
+            IAMStatement("B", "Allow", ["s3:GetObject"], ["arn:x"]),
+        ]
+
+    def teardown_method(self):
+        """Remove the temporary cache directory."""
+        self.temp_dir.cleanup()
+
+    def test_optimization_cache_misses_for_swapped_resources(self):
+        """Test statements granting each other's resources get separate optimization entries."""
+        data = self.analyzer._optimization_cache_data(self.statements, self.resources, "analysis")
+        self.analyzer.cache.set_optimization(data, '{"Version": "2012-10-17"}')
+
+        swapped = self.analyzer._optimization_cache_data(self.swapped, self.resources, "analysis")
+        assert self.analyzer.cache.get_optimization(swapped) is None
+        assert self.analyzer.cache.get_optimization(data) == '{"Version": "2012-10-17"}'
+
+    def test_verification_cache_misses_for_swapped_resources(self):
+        """Test verification is requested again when statements swap their resources."""
+        with mock.patch.object(
+            self.analyzer,
+            "_create_chat_completion",
+            return_value=_response('{"analysis": "VERIFICATION: PASSED"}'),
+        ) as create:
+            self.analyzer.verify_and_optimize_policy(self.statements, self.resources, "", True)
+            self.analyzer.verify_and_optimize_policy(self.statements, self.resources, "", True)
+            assert create.call_count == 1
+
+            self.analyzer.verify_and_optimize_policy(self.swapped, self.resources, "", True)
+            assert create.call_count == 2
+
+    def test_policy_reuse_requires_the_same_grants(self):
+        """Test an optimized policy is only reused for identical effect/action/resource grants."""
+        grants = self.analyzer._policy_grants(self.statements)
+        regrouped = [IAMStatement("AB", "Allow", ["s3:GetObject"], ["arn:y", "arn:x"])]
+        denied = [IAMStatement(s.sid, "Deny", s.action, s.resource) for s in self.statements]
+
+        assert self.analyzer._policy_grants(regrouped) == grants
+        assert self.analyzer._policy_grants(denied) != grants
+        assert self.analyzer._policy_grants(self.statements[:1]) != grants
+
+    def test_failed_batch_leaves_cache_counting_to_fallback(self):
+        """Test statements are not counted twice when a batch falls back to concurrent requests."""
+        statements = [
+            IAMStatement(f"S{i}", "Allow", ["s3:GetObject"], [f"arn:{i}"])
+            for i in range(self.analyzer.BATCH_MIN_STATEMENTS)
+        ]
+        self.analyzer.cache.set(self.analyzer._statement_cache_data(statements[0]), "cached")
+
+        with mock.patch.object(self.analyzer, "_run_explanation_batch", return_value=None):
+            with mock.patch.object(
+                self.analyzer, "enhance_statements_with_progress", return_value=statements
+            ) as fallback:
+                self.analyzer.enhance_statements_batch(statements, quiet=True)
+
+        fallback.assert_called_once()
+        assert (self.analyzer.cache_hits, self.analyzer.cache_misses) == (0, 0)
+
+        with mock.patch.object(self.analyzer, "_run_explanation_batch", return_value=""):
+            self.analyzer.enhance_statements_batch(statements, quiet=True)
+
+        assert (self.analyzer.cache_hits, self.analyzer.cache_misses) == (1, len(statements) - 1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
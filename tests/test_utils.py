@@ -1,6 +1,8 @@
 """Tests for utility modules."""
 
 import sys
+import tempfile
+import time
 from pathlib import Path
 
 import pytest
@@ -10,6 +12,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from tfiam.utils.arn_builder import ARNBuilder
 from tfiam.utils.aws_permissions import AWS_PERMISSIONS
+from tfiam.utils.cache import AIResponseCache
+from tfiam.utils.rate_limiter import RateLimiter, retry_with_backoff
 
 
 class TestARNBuilder:
@@ -154,5 +158,80 @@ class TestAWSPermissions:
                 ), f"Duplicate permissions found in {service}.{resource_type}"
 
 
+class TestAIResponseCache:
+    """Test cases for AIResponseCache."""
+
+    def test_optimization_key_covers_model_and_full_statements(self):
+        """Test optimization cache keys change with the model and any action."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = AIResponseCache(temp_dir)
+            data = {
+                "model": "gpt-4o-mini",
+                "terraform_resources": ["aws_s3_bucket:test"],
+                "policy_statements": ["S3Bucket:Allow:s3:A,s3:B,s3:C,s3:D:arn:aws:s3:::b"],
+                "verification_analysis": "ok",
+            }
+            cache.set_optimization(data, "{}")
+
+            assert cache.get_optimization(dict(data)) == "{}"
+            assert cache.get_optimization({**data, "model": "gpt-4o"}) is None
+            assert (
+                cache.get_optimization(
+                    {
+                        **data,
+                        "policy_statements": ["S3Bucket:Allow:s3:A,s3:B,s3:C,s3:E:arn:aws:s3:::b"],
+                    }
+                )
+                is None
+            )
+
+    def test_entries_expire_after_max_age(self):
+        """Test entries older than max_age are treated as misses."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            AIResponseCache(temp_dir).set({"sid": "S3Bucket"}, "explanation")
+
+            assert AIResponseCache(temp_dir).get({"sid": "S3Bucket"}) == "explanation"
+            assert AIResponseCache(temp_dir, max_age=-1).get({"sid": "S3Bucket"}) is None
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter and retry_with_backoff."""
+
+    def test_acquire_waits_when_request_budget_is_spent(self):
+        """Test acquire blocks once the per-minute request budget is used up."""
+        limiter = RateLimiter(requests_per_minute=1200, tokens_per_minute=1000000)
+        for _ in range(1200):
+            limiter.acquire()
+
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start >= 0.03
+
+    def test_acquire_caps_oversized_token_requests(self):
+        """Test a request larger than the token budget does not block forever."""
+        limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=100)
+        limiter.acquire(tokens=500)
+        assert limiter._available_tokens < 1
+
+    def test_retry_with_backoff_retries_listed_exceptions(self):
+        """Test retried calls eventually succeed and other errors propagate."""
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise TimeoutError("rate limited")
+            return "ok"
+
+        assert retry_with_backoff(flaky, retry_on=(TimeoutError,), base_delay=0)() == "ok"
+        assert len(attempts) == 3
+
+        def broken():
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            retry_with_backoff(broken, retry_on=(TimeoutError,), base_delay=0)()
+
+
 if __name__ == "__main__":
     pytest.main([__file__])